@@ -120,6 +120,9 @@ AEC_DELTA = 1e-6              # Regularisation to prevent divide-by-zero
 JITTER_MIN_FRAMES = 3         # Buffer this many frames before starting playback
 JITTER_MAX_FRAMES = 15        # Max buffer depth before dropping old frames
 
+# Level meter — report speaker level every Nth received frame (~25 Hz at 20 ms)
+SPEAKER_LEVEL_EVERY = 2
+
 # Hotline (always-on) soft noise suppression settings
 HOTLINE_SUPPRESS_DB = 15        # dB of suppression when no voice detected
 HOTLINE_VOICE_THRESH = 2.5      # RMS must exceed noise_floor * this to count as voice
@@ -312,7 +315,9 @@ class AudioManager:
         # Opus encoder/decoder (created lazily to handle import failure)
         self._opus_encoder = None
         self._opus_decoder = None
-        self._codec_lock = threading.Lock()
+        # Separate locks so decoding incoming audio never waits on mic encoding
+        self._encode_lock = threading.Lock()
+        self._decode_lock = threading.Lock()
         self._init_opus()
 
         # Codec state — default to best available codec immediately.
@@ -336,6 +341,7 @@ class AudioManager:
         # Audio level callbacks (0.0–1.0 range)
         self.mic_level_callback = None
         self.speaker_level_callback = None
+        self._speaker_level_count = 0
 
         # Threading state
         self.listening = False
@@ -409,7 +415,7 @@ class AudioManager:
 
     def _encode(self, raw_bytes):
         """Encode raw int16 PCM to compressed bytes using the active codec."""
-        with self._codec_lock:
+        with self._encode_lock:
             if self._active_codec == self.CODEC_OPUS and self._opus_encoder:
                 return self._opus_encoder.encode(raw_bytes, OPUS_FRAME_SIZE)
             else:
@@ -419,7 +425,7 @@ class AudioManager:
         """Decode compressed bytes back to int16 PCM using the active codec.
         Returns silence on failure — never tries the wrong codec, since
         µ-law will happily decode any bytes into noise."""
-        with self._codec_lock:
+        with self._decode_lock:
             if self._active_codec == self.CODEC_OPUS and self._opus_decoder:
                 try:
                     return self._opus_decoder.decode(data, OPUS_FRAME_SIZE)
@@ -665,14 +671,16 @@ class AudioManager:
         try:
             # Decode (Opus or µ-law)
             raw = self._decode(data)
-            audio_data = np.frombuffer(raw, dtype=DTYPE).copy()
+            # Read-only view is fine: frames are only ever copied out of the buffer
+            audio_data = np.frombuffer(raw, dtype=DTYPE)
             if len(audio_data) % CHANNELS != 0:
                 return
 
             audio_data = audio_data.reshape(-1, CHANNELS)
 
-            # Report speaker level
-            if self.speaker_level_callback:
+            # Report speaker level (throttled — each report is a queued Qt signal)
+            self._speaker_level_count += 1
+            if self.speaker_level_callback and self._speaker_level_count % SPEAKER_LEVEL_EVERY == 0:
                 rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
                 level = min(1.0, rms / 32768.0 * 10)
                 self.speaker_level_callback(level)
@@ -4,6 +4,8 @@ import os
 TCP_PORT = int(os.environ.get('VOX_TCP_PORT', 50000))
 UDP_PORT = int(os.environ.get('VOX_UDP_PORT', 50001))
 BUFFER_SIZE = 4096    # Network buffer size
+LAN_CONNECT_TIMEOUT = 3  # Seconds for direct TCP connect + TLS handshake
+AUDIO_UDP_RCVBUF = 256 * 1024  # Kernel receive buffer for audio UDP sockets
 
 # Audio Configuration (optimised for clear, low-latency voice)
 SAMPLE_RATE = 24000   # Hz — super-wideband (clear voice without excess bandwidth)
@@ -39,19 +41,44 @@ APP_NAME = "Vox"
 LOG_LEVEL = os.environ.get('VOX_LOG_LEVEL', 'INFO')
 
 # ── Logging Setup ─────────────────────────────────────────────
+import atexit
 import logging
+import logging.handlers
+import queue
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second."""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._ts_sec = None
+        self._ts_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._ts_sec:
+            self._ts_str = super().formatTime(record, datefmt)
+            self._ts_sec = sec
+        return self._ts_str
 
 
 def setup_logging():
-    """Configure the application-wide logger."""
+    """Configure the application-wide logger.
+    Callers (GUI, network and audio threads) only enqueue records; formatting
+    and stream writes happen on a single background listener thread."""
     logger = logging.getLogger('vox')
     if logger.handlers:
         return logger  # Already configured
     logger.setLevel(getattr(logging, LOG_LEVEL.upper(), logging.INFO))
-    fmt = logging.Formatter('[%(asctime)s] %(name)s.%(module)s: %(message)s', datefmt='%H:%M:%S')
+    fmt = _CachedTimeFormatter('[%(asctime)s] %(name)s.%(module)s: %(message)s', datefmt='%H:%M:%S')
     sh = logging.StreamHandler()
     sh.setFormatter(fmt)
-    logger.addHandler(sh)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, sh)
+    listener.start()
+    atexit.register(listener.stop)  # Flush pending records on exit
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     return logger
 
 log = setup_logging()
@@ -35,6 +35,7 @@ class DeckWSServer:
         self._loop = None
         self._thread = None
         self._state = {}
+        self._state_json = None  # Serialized self._state, shared by all sends
         self._server = None
         self._ready = threading.Event()
 
@@ -46,14 +47,21 @@ class DeckWSServer:
         self._thread.start()
 
     def broadcast_state(self, state: dict):
-        """Send full state snapshot to all connected plugins."""
+        """Send full state snapshot to all connected plugins.
+        Snapshots identical to the last one are dropped — plugins already
+        have that state, and new clients get it on connect."""
+        if state == self._state:
+            return
         self._state = state
+        # Serialize once; the same payload goes to every client and is
+        # replayed to plugins that connect later.
+        self._state_json = json.dumps({"type": "state", **state})
         if not self._ready.is_set():
             return  # Server not ready yet — state is cached for new clients
         if self._loop and not self._loop.is_closed():
             self._loop.call_soon_threadsafe(
                 asyncio.ensure_future,
-                self._broadcast(json.dumps({"type": "state", **state}))
+                self._broadcast(self._state_json)
             )
 
     def stop(self):
@@ -116,9 +124,9 @@ class DeckWSServer:
         self._clients.add(ws)
         self._log(f"[DeckWS] Plugin connected ({len(self._clients)} client(s))")
         # Send current state immediately
-        if self._state:
+        if self._state_json:
             try:
-                await ws.send(json.dumps({"type": "state", **self._state}))
+                await ws.send(self._state_json)
             except Exception:
                 pass
         try:
@@ -58,6 +58,7 @@ from ui_constants import (
     DARK,
     LIGHT,
     MODE_LABELS,
+    MODE_META,
     PANEL_RADIUS,
     PANEL_W,
     SIDEBAR_W,
@@ -506,10 +507,16 @@ class FloatingPanel(QWidget):
 
         return sidebar
 
+    @staticmethod
+    def _mode_meta(mode):
+        """Return (color, label) for a mode, falling back to Available/green."""
+        meta = MODE_META.get(mode, MODE_META['GREEN'])
+        return meta.color, meta.label
+
     def _update_traffic_light(self):
         """Style the single status orb to reflect the current mode."""
         mode = getattr(self, '_current_mode', 'GREEN')
-        color = COLORS.get(mode, COLORS['GREEN'])
+        color, label = self._mode_meta(mode)
         self._status_orb_btn.setStyleSheet(f"""
             QPushButton {{
                 background: transparent; border: none;
@@ -519,7 +526,7 @@ class FloatingPanel(QWidget):
             }}
             QPushButton:hover {{ background: {DARK['BG_HOVER']}; }}
         """)
-        self._status_orb_btn.setToolTip(MODE_LABELS.get(mode, mode))
+        self._status_orb_btn.setToolTip(label)
 
     def _show_status_dropdown(self):
         """Show a dropdown menu to pick status (Available / Busy / DND)."""
@@ -866,7 +873,7 @@ class FloatingPanel(QWidget):
 
         # Hotline toggle (only visible during active calls)
         self._hotline_lbl = QLabel("Hotline")
-        self._hotline_lbl.setStyleSheet(f"font-size: 11px; color: {DARK['TEXT_DIM']}; font-weight: 500; border: none;")
+        self._hotline_lbl.setStyleSheet(self._hotline_lbl_style())
         self._hotline_lbl.setVisible(False)
         title_row.addWidget(self._hotline_lbl)
 
@@ -2125,35 +2132,53 @@ class FloatingPanel(QWidget):
     def _update_ptt_style(self):
         """Style the PTT button — teal-bordered, mode-aware."""
         mode = self._current_mode
-        text_color = self._MODE_TEXT_COLORS.get(mode, '#4cdf80')
-
-        if mode == 'RED':
-            # DND — disabled look
-            self.ptt_btn.setEnabled(False)
-            self.ptt_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: rgba(229, 57, 53, 0.05);
-                    border: 1px solid {DARK['BORDER']};
-                    border-radius: 8px;
-                    padding: 8px; font-size: 12px;
-                    font-weight: 700; color: {DARK['TEXT_FAINT']};
-                    letter-spacing: 0.5px;
-                }}
-            """)
-        else:
-            self.ptt_btn.setEnabled(True)
-            self.ptt_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    border: 1px solid {DARK['TEAL']};
-                    border-radius: 8px;
-                    padding: 8px; font-size: 12px;
-                    font-weight: 700; color: {text_color};
-                    letter-spacing: 0.5px;
-                }}
-                QPushButton:hover {{ background: rgba(42, 191, 191, 0.08); }}
-                QPushButton:pressed {{ background: rgba(42, 191, 191, 0.15); }}
-            """)
+        # RED (DND) — disabled look
+        self.ptt_btn.setEnabled(mode != 'RED')
+        self._set_ptt_state({'RED': 'dnd', 'YELLOW': 'busy'}.get(mode, 'idle'))
+
+    def _set_ptt_state(self, state):
+        """Switch the PTT button between idle/busy/dnd/speaking/locked.
+        PTT press/release lands here, so only the 'talkState' property is
+        flipped; the stylesheet (_ptt_btn_style) is installed once per theme."""
+        btn = self.ptt_btn
+        if not btn.styleSheet():
+            btn.setStyleSheet(self._ptt_btn_style())
+        if btn.property("talkState") != state:
+            btn.setProperty("talkState", state)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+
+    def _ptt_btn_style(self):
+        """Stylesheet for the PTT button, keyed on its 'talkState' property."""
+        return f"""
+            QPushButton {{
+                background: transparent;
+                border: 1px solid {DARK['TEAL']};
+                border-radius: 8px;
+                padding: 8px; font-size: 12px;
+                font-weight: 700; color: {self._MODE_TEXT_COLORS['GREEN']};
+                letter-spacing: 0.5px;
+            }}
+            QPushButton:hover {{ background: rgba(42, 191, 191, 0.08); }}
+            QPushButton:pressed {{ background: rgba(42, 191, 191, 0.15); }}
+            QPushButton[talkState="busy"] {{ color: {self._MODE_TEXT_COLORS['YELLOW']}; }}
+            QPushButton[talkState="dnd"] {{
+                background: rgba(229, 57, 53, 0.05);
+                border: 1px solid {DARK['BORDER']};
+                color: {DARK['TEXT_FAINT']};
+            }}
+            QPushButton[talkState="speaking"],
+            QPushButton[talkState="speaking"]:hover,
+            QPushButton[talkState="speaking"]:pressed {{
+                background: rgba(226, 42, 26, 0.15); border: 2px solid {DARK['DANGER']};
+                color: {DARK['DANGER']};
+            }}
+            QPushButton[talkState="locked"] {{
+                background: {DARK['BG_RAISED']};
+                border: 1px solid {DARK['BORDER']};
+                font-weight: 600; color: {DARK['TEXT_FAINT']};
+            }}
+        """
 
     # ── Connection Bar ────────────────────────────────────────────
     def _build_conn_bar(self):
@@ -3258,8 +3283,7 @@ class FloatingPanel(QWidget):
 
     def _update_pinned_style(self):
         """Update the pinned compact bar to match the PTT button shape, colored by mode."""
-        color_hex = COLORS.get(self._current_mode, COLORS['GREEN'])
-        label = MODE_LABELS.get(self._current_mode, 'Available')
+        color_hex, label = self._mode_meta(self._current_mode)
         name = getattr(self, '_display_name', 'Vox')
         self.pinned_ptt.setText(f"{name}  -  {label}")
         # Convert hex to rgba for translucency
@@ -3375,37 +3399,43 @@ class FloatingPanel(QWidget):
         return strip
 
     def _update_strip_ptt_style(self, active=False):
-        """Style the strip PTT button — red glow when active, teal outline at rest."""
-        if active:
-            self._strip_ptt_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: rgba(226, 42, 26, 0.2);
-                    border: 2px solid {DARK['DANGER']};
-                    border-radius: 8px;
-                    font-size: 10px; font-weight: 700;
-                    color: {DARK['DANGER']};
-                    letter-spacing: 0.5px;
-                    padding-bottom: 4px;
-                }}
-            """)
-        else:
-            self._strip_ptt_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    border: 1px solid {DARK['TEAL']};
-                    border-radius: 8px;
-                    font-size: 10px; font-weight: 700;
-                    color: {DARK['TEAL']};
-                    letter-spacing: 0.5px;
-                    padding-bottom: 4px;
-                }}
-                QPushButton:hover {{ background: {DARK['BG_HOVER']}; }}
-                QPushButton:pressed {{ background: {DARK['ACCENT']}; }}
-            """)
+        """Style the strip PTT button — red glow when active, teal outline at rest.
+        Called on every PTT press/release, so it only flips the 'pttActive'
+        property; the stylesheet itself is installed once per theme."""
+        btn = self._strip_ptt_btn
+        if not btn.styleSheet():
+            btn.setStyleSheet(self._strip_ptt_btn_style())
+        if btn.property("pttActive") != active:
+            btn.setProperty("pttActive", active)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+
+    def _strip_ptt_btn_style(self):
+        """Stylesheet for the strip PTT button, keyed on its 'pttActive' property."""
+        return f"""
+            QPushButton {{
+                background: transparent;
+                border: 1px solid {DARK['TEAL']};
+                border-radius: 8px;
+                font-size: 10px; font-weight: 700;
+                color: {DARK['TEAL']};
+                letter-spacing: 0.5px;
+                padding-bottom: 4px;
+            }}
+            QPushButton:hover {{ background: {DARK['BG_HOVER']}; }}
+            QPushButton:pressed {{ background: {DARK['ACCENT']}; }}
+            QPushButton[pttActive="true"],
+            QPushButton[pttActive="true"]:hover,
+            QPushButton[pttActive="true"]:pressed {{
+                background: rgba(226, 42, 26, 0.2);
+                border: 2px solid {DARK['DANGER']};
+                color: {DARK['DANGER']};
+            }}
+        """
 
     def _update_strip_status_dot(self):
         """Update the strip status button to reflect current mode (matches full panel orb)."""
-        color = COLORS.get(self._current_mode, COLORS['GREEN'])
+        color, label = self._mode_meta(self._current_mode)
         self._strip_status_dot.setText("●")
         self._strip_status_dot.setStyleSheet(f"""
             QPushButton {{
@@ -3417,7 +3447,7 @@ class FloatingPanel(QWidget):
             QPushButton:hover {{ background: {DARK['BG_HOVER']}; }}
         """)
         self._strip_status_dot.setToolTip(
-            f"Status: {MODE_LABELS.get(self._current_mode, 'Available')} — click to change"
+            f"Status: {label} — click to change"
         )
 
     def _show_strip_mode_menu(self):
@@ -3611,10 +3641,20 @@ class FloatingPanel(QWidget):
     def set_hotline_enabled(self, enabled):
         """Enable/disable hotline toggle (only active when connected)."""
         self.open_toggle.setEnabled(enabled)
-        if not enabled and not self._is_open_line:
-            self._hotline_lbl.setStyleSheet(f"font-size: 12px; color: {DARK['TEXT_FAINT']}; font-weight: 500; border: none;")
-        else:
-            self._hotline_lbl.setStyleSheet(f"font-size: 12px; color: {DARK['TEXT_DIM']}; font-weight: 500; border: none;")
+        state = "off" if not enabled and not self._is_open_line else "on"
+        if self._hotline_lbl.property("hotline") != state:
+            # Flip the property and re-polish rather than re-parsing a stylesheet
+            self._hotline_lbl.setProperty("hotline", state)
+            self._hotline_lbl.style().unpolish(self._hotline_lbl)
+            self._hotline_lbl.style().polish(self._hotline_lbl)
+
+    def _hotline_lbl_style(self):
+        """Stylesheet for the hotline label, keyed on its 'hotline' property."""
+        return f"""
+            QLabel {{ font-size: 11px; color: {DARK['TEXT_DIM']}; font-weight: 500; border: none; }}
+            QLabel[hotline="on"] {{ font-size: 12px; color: {DARK['TEXT_DIM']}; }}
+            QLabel[hotline="off"] {{ font-size: 12px; color: {DARK['TEXT_FAINT']}; }}
+        """
 
     def set_sidebar_team(self, team_name):
         """Show the active team name in the sidebar."""
@@ -3750,52 +3790,57 @@ class FloatingPanel(QWidget):
         if selected_user_id and selected_user_id not in old_states:
             old_states[selected_user_id] = UserRow.STATE_SELECTED
 
-        # Clear existing
-        self._user_rows = {}
-        while self._user_layout.count() > 1:  # keep the stretch
-            item = self._user_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        all_users = []  # flat list for favorites/strip
-        total_online = 0
-
-        for group in team_groups:
-            team_name = group.get('team_name', 'Team')
-            users = group.get('users', [])
-            if not users:
-                continue
-
-            # ── Team section header ──
-            header = QLabel(team_name.upper())
-            header.setStyleSheet(f"""
-                font-size: 10px; font-weight: 700; color: {DARK['TEXT_DIM']};
-                letter-spacing: 1px; padding: 8px 12px 2px 12px; border: none;
-            """)
-            self._user_layout.insertWidget(self._user_layout.count() - 1, header)
-
-            for u in users:
-                uid = u.get('id', '')
-                row = UserRow(
-                    uid,
-                    u.get('name', 'Unknown'),
-                    u.get('mode', 'GREEN'),
-                    u.get('has_message', False)
-                )
-                row.call_clicked.connect(self.call_user_requested.emit)
-                row.intercom_pressed.connect(self.intercom_pressed.emit)
-                row.intercom_released.connect(self.intercom_released.emit)
-                row.open_line_requested.connect(self.open_line_requested.emit)
-                row.leave_message_requested.connect(self.leave_message_requested.emit)
-                row.user_selected.connect(self._on_user_row_clicked)
-                if uid in old_states:
-                    row.set_state(old_states[uid])
-                self._user_rows[uid] = row
-                self._user_layout.insertWidget(self._user_layout.count() - 1, row)
-                all_users.append(u)
-                if u.get('mode') != 'OFFLINE':
-                    total_online += 1
+        # Batch the rebuild into a single repaint instead of one per row
+        self._user_container.setUpdatesEnabled(False)
 
+        try:
+            # Clear existing
+            self._user_rows = {}
+            while self._user_layout.count() > 1:  # keep the stretch
+                item = self._user_layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+
+            all_users = []  # flat list for favorites/strip
+            total_online = 0
+
+            for group in team_groups:
+                team_name = group.get('team_name', 'Team')
+                users = group.get('users', [])
+                if not users:
+                    continue
+
+                # ── Team section header ──
+                header = QLabel(team_name.upper())
+                header.setStyleSheet(f"""
+                    font-size: 10px; font-weight: 700; color: {DARK['TEXT_DIM']};
+                    letter-spacing: 1px; padding: 8px 12px 2px 12px; border: none;
+                """)
+                self._user_layout.insertWidget(self._user_layout.count() - 1, header)
+
+                for u in users:
+                    uid = u.get('id', '')
+                    row = UserRow(
+                        uid,
+                        u.get('name', 'Unknown'),
+                        u.get('mode', 'GREEN'),
+                        u.get('has_message', False)
+                    )
+                    row.call_clicked.connect(self.call_user_requested.emit)
+                    row.intercom_pressed.connect(self.intercom_pressed.emit)
+                    row.intercom_released.connect(self.intercom_released.emit)
+                    row.open_line_requested.connect(self.open_line_requested.emit)
+                    row.leave_message_requested.connect(self.leave_message_requested.emit)
+                    row.user_selected.connect(self._on_user_row_clicked)
+                    if uid in old_states:
+                        row.set_state(old_states[uid])
+                    self._user_rows[uid] = row
+                    self._user_layout.insertWidget(self._user_layout.count() - 1, row)
+                    all_users.append(u)
+                    if u.get('mode') != 'OFFLINE':
+                        total_online += 1
+        finally:
+            self._user_container.setUpdatesEnabled(True)
         self.online_count.setText(str(total_online))
 
         # Cache users (needed by _update_favorites and _sync_fav_selection)
@@ -3944,15 +3989,7 @@ class FloatingPanel(QWidget):
     def set_ptt_active(self, active):
         """Visual feedback when PTT is held — both main button and compact strip."""
         if active:
-            self.ptt_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: rgba(226, 42, 26, 0.15); border: 2px solid {DARK['DANGER']};
-                    border-radius: 8px;
-                    padding: 8px; font-size: 12px;
-                    font-weight: 700; color: {DARK['DANGER']};
-                    letter-spacing: 0.5px;
-                }}
-            """)
+            self._set_ptt_state('speaking')
         else:
             # Restore normal style
             self._update_ptt_style()
@@ -3965,16 +4002,7 @@ class FloatingPanel(QWidget):
         if locked:
             self.ptt_btn.setEnabled(False)
             self.ptt_btn.setText("LISTENING...")
-            self.ptt_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {DARK['BG_RAISED']};
-                    border: 1px solid {DARK['BORDER']};
-                    border-radius: 8px;
-                    padding: 8px; font-size: 12px;
-                    font-weight: 600; color: {DARK['TEXT_FAINT']};
-                    letter-spacing: 0.5px;
-                }}
-            """)
+            self._set_ptt_state('locked')
         else:
             self.ptt_btn.setEnabled(True)
             # Restore text
@@ -4762,14 +4790,20 @@ class FloatingPanel(QWidget):
         """Ask user to confirm leaving the current team."""
         from PySide6.QtWidgets import QMessageBox
         team_name = self._team_combo.currentText() if self._team_combo.count() > 0 else "this team"
-        reply = QMessageBox.question(
-            self, "Leave Team",
-            f"Leave \"{team_name}\"?\n\nYou'll need an invite code to rejoin.",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
-        )
-        if reply == QMessageBox.Yes:
-            self.leave_team_requested.emit()
+        # Non-modal: QMessageBox.question() would spin a nested event loop
+        # while the user decides.
+        box = QMessageBox(QMessageBox.Question, "Leave Team",
+                          f"Leave \"{team_name}\"?\n\nYou'll need an invite code to rejoin.",
+                          QMessageBox.Yes | QMessageBox.No, self)
+        box.setDefaultButton(QMessageBox.No)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+
+        def _on_clicked(btn):
+            if box.standardButton(btn) == QMessageBox.Yes:
+                self.leave_team_requested.emit()
+
+        box.buttonClicked.connect(_on_clicked)
+        box.open()
 
     def _toggle_incognito(self):
         self._incognito = not self._incognito
@@ -4823,6 +4857,10 @@ class FloatingPanel(QWidget):
                 border-bottom-left-radius: {PANEL_RADIUS}px;
             }}
         """)
+        self._hotline_lbl.setStyleSheet(self._hotline_lbl_style())
+        self.ptt_btn.setStyleSheet(self._ptt_btn_style())
+        if hasattr(self, '_strip_ptt_btn'):
+            self._strip_ptt_btn.setStyleSheet(self._strip_ptt_btn_style())
         # Re-populate settings so tile colors update
         self._populate_settings()
         self.update()
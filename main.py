@@ -44,6 +44,27 @@ from user_settings import (
     set_display_name,
 )
 
+# Voicemail files live in the config dir; resolve it once rather than per message
+_MSG_DIR = _config_dir()
+_MSG_CLEANUP_GLOBS = tuple(
+    os.path.join(_MSG_DIR, pattern)
+    for pattern in ("outgoing_message.wav", "incoming_message.wav", "msg_*.wav")
+)
+
+_MSG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_message_file(path, data):
+    """Write a received message straight to disk with os.write — no buffered
+    file object, so the payload isn't copied into an intermediate buffer."""
+    fd = os.open(path, _MSG_OPEN_FLAGS, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 class IntercomApp(QObject):
     # Signals to update UI from other threads
@@ -77,12 +98,17 @@ class IntercomApp(QObject):
     MODE_YELLOW = "YELLOW"
     MODE_RED = "RED"
     MODE_LABELS = {"GREEN": "Available", "YELLOW": "Busy", "RED": "DND"}
+    # Mode cycle order; anything else (e.g. OPEN) cycles back to GREEN
+    _NEXT_MODE = {MODE_GREEN: MODE_YELLOW, MODE_YELLOW: MODE_RED, MODE_RED: MODE_GREEN}
 
     def __init__(self):
         super().__init__()
 
         # State
         self.mode = self.MODE_GREEN
+        # Read on the network RX thread per audio packet; kept in sync with
+        # self.mode wherever the mode is assigned.
+        self._audio_rx_enabled = True
         self.remote_mode = self.MODE_GREEN
         self._hotline_on = False
         self.peer_ip = "127.0.0.1"
@@ -102,6 +128,7 @@ class IntercomApp(QObject):
         self._pre_call_mode = None     # Mode before entering a call (restored on disconnect)
         self._pending_hotline = False  # True when open-line was requested, waiting for connection
         self._connected_peer_id = None # User ID of peer we're in a call with
+        self._invite_prompt_box = None  # Open non-modal invite prompt, if any
 
         # Intercom state (click to select + PTT)
         self._intercom_target_id = None   # user_id selected as PTT target
@@ -133,9 +160,36 @@ class IntercomApp(QObject):
         self._team_members = {}  # {team_id: {user_id: display_name}} — members per team
         self._pending_join_requests = {}  # request_id -> {team_id, requester_id, requester_name}
 
-        # Managers
-        self.network = NetworkManager(self.handle_network_message, log_callback=self.log_signal.emit)
-        self.audio = AudioManager(self.network, log_callback=self.log_signal.emit)
+        # Peer control message dispatch (see handle_network_message)
+        self._net_handlers = {
+            "STATUS": self._net_status,
+            "TALK_START": self._net_talk_start,
+            "TALK_STOP": self._net_talk_stop,
+            "CODEC_OFFER": self._net_codec_offer,
+            "CODEC_ACCEPT": self._net_codec_accept,
+            "PEER_CONNECTED": self._net_peer_connected,
+            "CONNECTION_REQUEST": self._net_connection_request,
+            "CONNECTION_ACCEPTED": self._net_connection_accepted,
+            "CALL_ENDED": self._net_call_ended,
+            "CONNECTION_REJECTED": self._net_connection_rejected,
+            "FILE_HEADER": self._net_file_header,
+            "BINARY_DATA": self._net_binary_data,
+        }
+
+        # Stream Deck plugin command dispatch (see _handle_ws_command)
+        self._ws_handlers = {
+            "ptt_press": self.on_talk_press,
+            "ptt_release": self.on_talk_release,
+            "cycle_mode": self.cycle_mode,  # Uses app's cycle (updates deck + panel + presence)
+            "cycle_team": self._ws_cycle_team,
+            "cycle_user": self._ws_cycle_user,
+            "show_panel": self._toggle_panel,
+        }
+
+        # Managers — they log straight through self.log (logging is
+        # thread-safe), avoiding a queued cross-thread signal hop per line.
+        self.network = NetworkManager(self.handle_network_message, log_callback=self.log)
+        self.audio = AudioManager(self.network, log_callback=self.log)
         self.network.audio_callback = self.handle_audio_stream
         self.network.presence_callback = self.handle_presence_message
         self.network.display_name = self.display_name
@@ -148,7 +202,7 @@ class IntercomApp(QObject):
         # Stream Deck Plugin WebSocket bridge
         self.deck_ws = DeckWSServer(
             command_callback=lambda action, msg: self._ws_command_signal.emit(action, msg),
-            log_callback=lambda m: self.log_signal.emit(m),
+            log_callback=self.log,
         )
         self.deck_ws.start()
 
@@ -158,7 +212,7 @@ class IntercomApp(QObject):
             on_press=self._hotkey_talk_press,
             on_release=self._hotkey_talk_release,
             key_name=ptt_key,
-            log_callback=self.log_signal.emit,
+            log_callback=self.log,
         )
         # Global hotkey disabled — use the UI PTT button instead
         # self.hotkey.start()
@@ -166,6 +220,7 @@ class IntercomApp(QObject):
         # Discovery
         self.discovery = DiscoveryManager(self.on_peer_found, self.on_peer_lost)
         self.peer_map = {}
+        self._peer_names_lower = {}  # lowercased service name -> peer_map key
 
         # ── System Tray ────────────────────────────────────────
         self.tray = QSystemTrayIcon()
@@ -199,14 +254,9 @@ class IntercomApp(QObject):
         deck_connected = hasattr(self, 'deck_ws') and self.deck_ws.client_count > 0
         self.panel.set_deck_status(deck_connected)
 
-        # Start Services
-        self.discovery.register_service()
-        self.discovery.start_browsing()
-
-        # Timers
-        self.flash_timer = QTimer()
-        self.flash_timer.timeout.connect(self.flash_loop)
-        self.flash_timer.start(500)
+        # Start Services — mDNS registration blocks on network I/O, so bring
+        # it up off the GUI thread; peer callbacks already arrive via signals.
+        threading.Thread(target=self._start_discovery, daemon=True).start()
 
         # Signal connections
         self.log_signal.connect(self.log)
@@ -437,6 +487,7 @@ class IntercomApp(QObject):
         if is_on:
             old_mode = self.mode
             self.mode = self.MODE_GREEN
+            self._audio_rx_enabled = True
             self.panel.set_hotline(True)
             self.panel.set_mode(self.MODE_GREEN)
             self.tray.setIcon(create_oh_icon(COLORS['GREEN']))
@@ -448,6 +499,7 @@ class IntercomApp(QObject):
         else:
             # Restore to GREEN (default when turning off hotline)
             self.mode = self.MODE_GREEN
+            self._audio_rx_enabled = True
             self.audio.set_hotline(False)
             self.audio.stop_streaming()
             self.panel.set_hotline(False)
@@ -513,10 +565,9 @@ class IntercomApp(QObject):
         if target_name in self.peer_map:
             return self.peer_map[target_name]
         # Case-insensitive exact match
-        lower = target_name.lower()
-        for name, ip in self.peer_map.items():
-            if name.lower() == lower:
-                return ip
+        name = self._peer_names_lower.get(target_name.lower())
+        if name is not None:
+            return self.peer_map.get(name)
         # Note: partial matching removed to avoid routing remote users
         # through the direct LAN path accidentally
         return None
@@ -826,23 +877,6 @@ class IntercomApp(QObject):
 
     # ── Presence Methods ──────────────────────────────────────────
 
-    def _prompt_for_name(self):
-        from PySide6.QtWidgets import QInputDialog
-        dialog = QInputDialog()
-        dialog.setWindowTitle("Welcome to Vox")
-        dialog.setLabelText("Enter your display name:")
-        ok = dialog.exec()
-        name = dialog.textValue()
-        if ok and name.strip():
-            self.display_name = name.strip()
-            set_display_name(self.display_name)
-            self.log(f"Display name set to: {self.display_name}")
-        else:
-            import socket
-            self.display_name = socket.gethostname()
-            set_display_name(self.display_name)
-            self.log(f"Using hostname: {self.display_name}")
-
     def _auto_connect_presence(self):
         time.sleep(1)
 
@@ -1016,7 +1050,9 @@ class IntercomApp(QObject):
     def _update_online_users_grouped(self, teams_dict):
         """Update the panel user list from grouped presence data.
         teams_dict: {team_id: [user_info, ...]}"""
-        self.online_users = {}
+        # online_users is updated in place below so a mode toggle only
+        # touches the one entry that changed.
+        incoming = {}
 
         # Build team_groups for the UI: [{team_id, team_name, users: [...]}, ...]
         team_groups = []
@@ -1033,7 +1069,7 @@ class IntercomApp(QObject):
                 uid = user.get("user_id", "")
                 name = user.get("name", "Unknown")
                 mode = user.get("mode", "GREEN")
-                self.online_users[uid] = {"name": name, "mode": mode, "room": user.get("room", ""), "team_id": tid}
+                incoming[uid] = {"name": name, "mode": mode, "room": user.get("room", ""), "team_id": tid}
                 group_users.append({
                     'id': uid,
                     'name': name,
@@ -1059,6 +1095,12 @@ class IntercomApp(QObject):
                 'users': group_users,
             })
 
+        for uid in [uid for uid in self.online_users if uid not in incoming]:
+            del self.online_users[uid]
+        for uid, info in incoming.items():
+            if self.online_users.get(uid) != info:
+                self.online_users[uid] = info
+
         # Flat list for backward compat (tray menu, deck state)
         flat_users = []
         for g in team_groups:
@@ -1111,6 +1153,14 @@ class IntercomApp(QObject):
 
     # ── Peer Discovery ────────────────────────────────────────────
 
+    def _start_discovery(self):
+        """Register our mDNS service and start browsing for LAN peers."""
+        try:
+            self.discovery.register_service()
+            self.discovery.start_browsing()
+        except Exception as e:
+            self.log(f"LAN discovery unavailable: {e}")
+
     def on_peer_found(self, name, ip):
         self.peer_found_signal.emit(name, ip)
 
@@ -1120,12 +1170,15 @@ class IntercomApp(QObject):
     def add_peer_to_ui(self, name, ip):
         if name not in self.peer_map:
             self.peer_map[name] = ip
+            self._peer_names_lower[name.lower()] = name
             self.log(f"Found Peer: {name} ({ip})")
             self._refresh_lan_user_list()
 
     def remove_peer_from_ui(self, name):
         if name in self.peer_map:
             del self.peer_map[name]
+            if self._peer_names_lower.get(name.lower()) == name:
+                del self._peer_names_lower[name.lower()]
             self.log(f"Lost Peer: {name}")
             self._refresh_lan_user_list()
 
@@ -1153,6 +1206,7 @@ class IntercomApp(QObject):
         self.panel.set_users(panel_users, self._intercom_target_id)
 
     def log(self, msg):
+        """Log a line. Safe to call from any thread."""
         log.info(msg)
 
     # ── Button / Deck Logic ───────────────────────────────────────
@@ -1160,18 +1214,9 @@ class IntercomApp(QObject):
     @Slot(str, dict)
     def _handle_ws_command(self, action, msg):
         """Handle commands from the Stream Deck plugin via WebSocket."""
-        if action == "ptt_press":
-            self.on_talk_press()
-        elif action == "ptt_release":
-            self.on_talk_release()
-        elif action == "cycle_mode":
-            self.cycle_mode()  # Uses app's cycle (updates deck + panel + presence)
-        elif action == "cycle_team":
-            self._ws_cycle_team()
-        elif action == "cycle_user":
-            self._ws_cycle_user()
-        elif action == "show_panel":
-            self._toggle_panel()
+        handler = self._ws_handlers.get(action)
+        if handler:
+            handler()
 
     def _ws_cycle_team(self):
         """Cycle through teams for WS plugin (mirrors plugin)."""
@@ -1255,7 +1300,7 @@ class IntercomApp(QObject):
             "message": getattr(self, 'has_message', False),
             "teams": teams,
             "users": users,
-            "activeTeamIds": getattr(self, 'active_team_ids', []),
+            "activeTeamIds": list(getattr(self, 'active_team_ids', [])),  # copy: compared against next snapshot
             "activeUserId": getattr(self, '_intercom_target_id', "") or "",
             "connected": getattr(self.network, 'connected', False),
             "peerName": self.online_users.get(self._connected_peer_id or "", {}).get("name", ""),
@@ -1461,13 +1506,11 @@ class IntercomApp(QObject):
 
     def _save_voicemail_from_buffer(self):
         """Save buffered audio from a peer who talked while we were busy."""
-        import time as _time
-
         import soundfile as sf
         sender_id = self._connected_peer_id or ""
         try:
             audio = np.concatenate(self._vm_buffer)
-            fn = os.path.join(_config_dir(), f"msg_{int(_time.time()*1000)}.wav")
+            fn = os.path.join(_MSG_DIR, f"msg_{int(time.time()*1000)}.wav")
             sf.write(fn, audio, SAMPLE_RATE)
             self._message_queue.append(fn)
             self.incoming_message_path = fn
@@ -1493,6 +1536,7 @@ class IntercomApp(QObject):
             return
         old_mode = self.mode
         self.mode = new_mode
+        self._audio_rx_enabled = new_mode == self.MODE_GREEN
         # Clear voicemail buffer if leaving busy mode
         if old_mode == self.MODE_YELLOW and hasattr(self, '_vm_buffer'):
             self._vm_buffer = []
@@ -1511,14 +1555,7 @@ class IntercomApp(QObject):
         self._update_ptt_for_mode()
 
     def cycle_mode(self):
-        if self.mode == self.MODE_GREEN:
-            self._set_mode(self.MODE_YELLOW)
-        elif self.mode == self.MODE_YELLOW:
-            self._set_mode(self.MODE_RED)
-        elif self.mode == self.MODE_RED:
-            self._set_mode(self.MODE_GREEN)
-        else:  # OPEN — cycling goes back to GREEN
-            self._set_mode(self.MODE_GREEN)
+        self._set_mode(self._NEXT_MODE.get(self.mode, self.MODE_GREEN))
 
     def _on_mode_set(self, mode):
         """Direct mode set from sidebar dropdown."""
@@ -1593,7 +1630,11 @@ class IntercomApp(QObject):
     # ── Network Callbacks ─────────────────────────────────────────
 
     def handle_audio_stream(self, data):
-        if self.mode == self.MODE_GREEN:
+        """Called directly on the network RX thread for every audio packet.
+        Keep this real-time safe: no logging and no Qt widget access. The one
+        signal on this path is play_audio_chunk's speaker level callback,
+        throttled to every SPEAKER_LEVEL_EVERY packets."""
+        if self._audio_rx_enabled:
             self.audio.play_audio_chunk(data)
         elif self.mode == self.MODE_YELLOW and self.peer_talking:
             # Busy mode: buffer incoming audio as a voicemail
@@ -1608,144 +1649,139 @@ class IntercomApp(QObject):
                 pass
 
     def handle_network_message(self, msg):
-        msg_type = msg.get("type")
-        payload = msg.get("payload")
-
-        if msg_type == "STATUS":
-            self.remote_mode = payload.get("mode")
-            self.log_signal.emit(f"Remote is now {self.remote_mode}")
-
-        elif msg_type == "TALK_START":
-            self.peer_talking = True
-            peer_id = self._connected_peer_id
-            print(f"[DEBUG] TALK_START: peer_id={peer_id}, rows={list(self.panel._user_rows.keys())}")
-            QTimer.singleShot(0, lambda: self.panel.set_ptt_locked(True))
-            if peer_id:
-                QTimer.singleShot(0, lambda: self.panel.set_user_state(peer_id, "live"))
-            self._broadcast_deck_state()
-            self.log_signal.emit("Peer is talking...")
-            # Start fresh voicemail buffer if we're busy
-            if self.mode == self.MODE_YELLOW:
-                self._vm_buffer = []
-
-        elif msg_type == "TALK_STOP":
-            self.peer_talking = False
-            peer_id = self._connected_peer_id
-            QTimer.singleShot(0, lambda: self.panel.set_ptt_locked(False))
-            if peer_id:
-                QTimer.singleShot(0, lambda: self.panel.set_user_state(peer_id, "selected"))
-            self._broadcast_deck_state()
-            self.audio.play_talk_ended()
-            # If we were in busy mode and buffered audio, save as voicemail
-            vm_count = len(self._vm_buffer) if hasattr(self, '_vm_buffer') else 0
-            print(f"[DEBUG] TALK_STOP: mode={self.mode}, vm_buffer={vm_count} chunks")
-            if self.mode == self.MODE_YELLOW and hasattr(self, '_vm_buffer') and self._vm_buffer:
-                self._save_voicemail_from_buffer()
-
-        elif msg_type == "CODEC_OFFER":
-            # Peer sent their supported codecs — pick the best common one and reply
-            peer_codecs = payload.get("codecs", ["ulaw"])
-            chosen = self.audio.negotiate_codec(peer_codecs)
-            self.network.send_control("CODEC_ACCEPT", {"codec": chosen})
-            if chosen == "ulaw":
-                self.log_signal.emit("⚠ Audio: µ-law (peer missing Opus)")
-            else:
-                self.log_signal.emit(f"Audio: {chosen}")
-
-        elif msg_type == "CODEC_ACCEPT":
-            # Peer accepted our codec offer — activate the chosen codec
-            chosen = payload.get("codec", "ulaw")
-            self.audio.negotiate_codec([chosen])
-            if chosen == "ulaw":
-                self.log_signal.emit("⚠ Audio: µ-law (peer missing Opus)")
-            else:
-                self.log_signal.emit(f"Audio: {chosen}")
-
-        elif msg_type == "PEER_CONNECTED":
-            ip = payload.get("ip", "unknown")
-            self.peer_ip = ip
-            self.log_signal.emit(f"Direct connection from {ip}")
-            self._send_codec_offer()
-
-        elif msg_type == "CONNECTION_REQUEST":
-            requester_name = payload.get("name", "Unknown")
-            self.log_signal.emit(f"Incoming direct LAN call from {requester_name}")
-            # Store caller name for accept handler
-            self._incoming_caller_name = requester_name
-            # Only overwrite pending state if we don't already have a relay call pending
-            if not self.pending_room:
-                self.pending_from_id = self.peer_ip or "direct"
-                self.pending_room = None  # No relay session for direct calls
-                self.presence_request_signal.emit(requester_name, self.pending_from_id, "")
-            else:
-                self.log_signal.emit("Ignoring direct CONNECTION_REQUEST — relay call already pending")
+        """Dispatch a control message from the peer to its _net_* handler."""
+        handler = self._net_handlers.get(msg.get("type"))
+        if handler:
+            handler(msg.get("payload"))
+
+    def _net_status(self, payload):
+        self.remote_mode = payload.get("mode")
+        self.log_signal.emit(f"Remote is now {self.remote_mode}")
+
+    def _net_talk_start(self, payload):
+        self.peer_talking = True
+        peer_id = self._connected_peer_id
+        print(f"[DEBUG] TALK_START: peer_id={peer_id}, rows={list(self.panel._user_rows.keys())}")
+        QTimer.singleShot(0, lambda: self.panel.set_ptt_locked(True))
+        if peer_id:
+            QTimer.singleShot(0, lambda: self.panel.set_user_state(peer_id, "live"))
+        self._broadcast_deck_state()
+        self.log_signal.emit("Peer is talking...")
+        # Start fresh voicemail buffer if we're busy
+        if self.mode == self.MODE_YELLOW:
+            self._vm_buffer = []
 
-        elif msg_type == "CONNECTION_ACCEPTED":
-            self.log_signal.emit("Call accepted!")
-            caller_name = payload.get("name", "Peer")
-            self.call_connected_signal.emit(caller_name)
-            self._start_open_line_if_ready()
+    def _net_talk_stop(self, payload):
+        self.peer_talking = False
+        peer_id = self._connected_peer_id
+        QTimer.singleShot(0, lambda: self.panel.set_ptt_locked(False))
+        if peer_id:
+            QTimer.singleShot(0, lambda: self.panel.set_user_state(peer_id, "selected"))
+        self._broadcast_deck_state()
+        self.audio.play_talk_ended()
+        # If we were in busy mode and buffered audio, save as voicemail
+        vm_count = len(self._vm_buffer) if hasattr(self, '_vm_buffer') else 0
+        print(f"[DEBUG] TALK_STOP: mode={self.mode}, vm_buffer={vm_count} chunks")
+        if self.mode == self.MODE_YELLOW and hasattr(self, '_vm_buffer') and self._vm_buffer:
+            self._save_voicemail_from_buffer()
+
+    def _net_codec_offer(self, payload):
+        # Peer sent their supported codecs — pick the best common one and reply
+        peer_codecs = payload.get("codecs", ["ulaw"])
+        chosen = self.audio.negotiate_codec(peer_codecs)
+        self.network.send_control("CODEC_ACCEPT", {"codec": chosen})
+        if chosen == "ulaw":
+            self.log_signal.emit("⚠ Audio: µ-law (peer missing Opus)")
+        else:
+            self.log_signal.emit(f"Audio: {chosen}")
+
+    def _net_codec_accept(self, payload):
+        # Peer accepted our codec offer — activate the chosen codec
+        chosen = payload.get("codec", "ulaw")
+        self.audio.negotiate_codec([chosen])
+        if chosen == "ulaw":
+            self.log_signal.emit("⚠ Audio: µ-law (peer missing Opus)")
+        else:
+            self.log_signal.emit(f"Audio: {chosen}")
+
+    def _net_peer_connected(self, payload):
+        ip = payload.get("ip", "unknown")
+        self.peer_ip = ip
+        self.log_signal.emit(f"Direct connection from {ip}")
+        self._send_codec_offer()
+
+    def _net_connection_request(self, payload):
+        requester_name = payload.get("name", "Unknown")
+        self.log_signal.emit(f"Incoming direct LAN call from {requester_name}")
+        # Store caller name for accept handler
+        self._incoming_caller_name = requester_name
+        # Only overwrite pending state if we don't already have a relay call pending
+        if not self.pending_room:
+            self.pending_from_id = self.peer_ip or "direct"
+            self.pending_room = None  # No relay session for direct calls
+            self.presence_request_signal.emit(requester_name, self.pending_from_id, "")
+        else:
+            self.log_signal.emit("Ignoring direct CONNECTION_REQUEST — relay call already pending")
 
+    def _net_connection_accepted(self, payload):
+        self.log_signal.emit("Call accepted!")
+        caller_name = payload.get("name", "Peer")
+        self.call_connected_signal.emit(caller_name)
+        self._start_open_line_if_ready()
 
-        elif msg_type == "CALL_ENDED":
-            # Remote peer ended the call — disconnect our side and restore mode
-            self.log_signal.emit("Call ended by peer.")
-            self.audio.stop_streaming()
-            self.audio.reset_codec()
-            self._clear_busy()
-            self.peer_talking = False
-            self._connected_peer_id = None
-            self.network.disconnect()
-            QTimer.singleShot(0, lambda: (self.panel.set_connection(False), self.panel.hide_call()))
+    def _net_call_ended(self, payload):
+        # Remote peer ended the call — disconnect our side and restore mode
+        self.log_signal.emit("Call ended by peer.")
+        self.audio.stop_streaming()
+        self.audio.reset_codec()
+        self._clear_busy()
+        self.peer_talking = False
+        self._connected_peer_id = None
+        self.network.disconnect()
+        QTimer.singleShot(0, lambda: (self.panel.set_connection(False), self.panel.hide_call()))
 
-        elif msg_type == "CONNECTION_REJECTED":
-            self.log_signal.emit("Connection declined.")
-            self.pending_connection = False
-            self.connection_response_signal.emit(False)
-            self.network.disconnect()
+    def _net_connection_rejected(self, payload):
+        self.log_signal.emit("Connection declined.")
+        self.pending_connection = False
+        self.connection_response_signal.emit(False)
+        self.network.disconnect()
 
-        elif msg_type == "FILE_HEADER":
-            self.incoming_file_size = payload.get("size", 0)
-            if self.incoming_file_size > MAX_FILE_SIZE:
-                self.log_signal.emit(f"Rejected message: too large ({self.incoming_file_size} bytes, max {MAX_FILE_SIZE})")
-                return
-            self.log_signal.emit(f"Receiving Message ({self.incoming_file_size} bytes)...")
+    def _net_file_header(self, payload):
+        self.incoming_file_size = payload.get("size", 0)
+        if self.incoming_file_size > MAX_FILE_SIZE:
+            self.log_signal.emit(f"Rejected message: too large ({self.incoming_file_size} bytes, max {MAX_FILE_SIZE})")
+            return
+        self.log_signal.emit(f"Receiving Message ({self.incoming_file_size} bytes)...")
 
-        elif msg_type == "BINARY_DATA":
-            data = payload
-            self.log_signal.emit(f"File Received: {len(data)} bytes")
-            try:
-                import time as _time
-                fn = os.path.join(_config_dir(), f"msg_{int(_time.time()*1000)}.wav")
-                with open(fn, 'wb') as f:
-                    f.write(data)
-                self._message_queue.append(fn)
-                self.incoming_message_path = fn
-                self.has_message = True
-                self.is_flashing = True
-                self.update_deck_display()
-                self.audio.play_notification()
-                self.message_received_signal.emit()
-                self.log_signal.emit("Message Saved.")
-            except Exception as e:
-                self.log_signal.emit(f"Error saving file: {e}")
+    def _net_binary_data(self, data):
+        self.log_signal.emit(f"File Received: {len(data)} bytes")
+        try:
+            fn = os.path.join(_MSG_DIR, f"msg_{int(time.time()*1000)}.wav")
+            _write_message_file(fn, data)
+            self._message_queue.append(fn)
+            self.incoming_message_path = fn
+            self.has_message = True
+            self.is_flashing = True
+            self.update_deck_display()
+            self.audio.play_notification()
+            self.message_received_signal.emit()
+            self.log_signal.emit("Message Saved.")
+        except Exception as e:
+            self.log_signal.emit(f"Error saving file: {e}")
 
     # ── Display ───────────────────────────────────────────────────
 
     def update_deck_display(self):
         self._broadcast_deck_state()
 
-    def flash_loop(self):
-        # Message pulsing handled by Stream Deck plugin
-        pass
-
     def _cleanup_messages(self):
-        cfg_dir = _config_dir()
         import glob
-        for pattern in ("outgoing_message.wav", "incoming_message.wav", "msg_*.wav"):
-            for path in glob.glob(os.path.join(cfg_dir, pattern)):
+        for pattern in _MSG_CLEANUP_GLOBS:
+            for path in glob.glob(pattern):
                 try:
-                    os.remove(path)
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass  # Already gone (e.g. played and removed meanwhile)
                 except OSError as e:
                     print(f"Could not delete {path}: {e}")
         self._message_queue.clear()
@@ -1991,20 +2027,33 @@ class IntercomApp(QObject):
     def _show_invite_prompt(self, team_name, invite_code):
         """After creating a team, ask if the user wants to invite people."""
         from PySide6.QtWidgets import QMessageBox
+        # Non-modal so the event loop (presence, audio, deck) keeps running
+        # while the prompt is up; a newer prompt replaces any pending one.
+        if self._invite_prompt_box is not None:
+            self._invite_prompt_box.close()
         msg = QMessageBox(self.panel)
+        msg.setAttribute(Qt.WA_DeleteOnClose)
         msg.setWindowTitle("Invite Your Team")
         msg.setText(f'"{team_name}" is ready!\n\nInvite your teammates?')
         msg.setInformativeText(f"Invite code: {invite_code}")
         email_btn = msg.addButton("Send Email Invite", QMessageBox.AcceptRole)
         copy_btn = msg.addButton("Copy Code", QMessageBox.ActionRole)
         msg.addButton("Later", QMessageBox.RejectRole)
-        msg.exec()
-        clicked = msg.clickedButton()
-        if clicked == email_btn:
-            self.panel._invite_friend_email()
-        elif clicked == copy_btn:
-            from PySide6.QtWidgets import QApplication
-            QApplication.clipboard().setText(invite_code)
+
+        def _on_clicked(clicked):
+            if clicked == email_btn:
+                self.panel._invite_friend_email()
+            elif clicked == copy_btn:
+                QApplication.clipboard().setText(invite_code)
+
+        def _on_destroyed():
+            if self._invite_prompt_box is msg:
+                self._invite_prompt_box = None
+
+        msg.buttonClicked.connect(_on_clicked)
+        msg.destroyed.connect(_on_destroyed)
+        self._invite_prompt_box = msg
+        msg.open()
 
     @Slot(str)
     def _on_create_team(self, team_name):
@@ -1,17 +1,197 @@
 import json
+import logging
+import os
+import queue
 import socket
 import ssl
 import struct
 import threading
 import time
 
-from config import BUFFER_SIZE, MAX_FRAME_SIZE, RELAY_AUTH_KEY, RELAY_CA_CERT, RELAY_PORT, RELAY_TLS, TCP_PORT, UDP_PORT
+from config import (
+    AUDIO_UDP_RCVBUF,
+    BUFFER_SIZE,
+    LAN_CONNECT_TIMEOUT,
+    MAX_FRAME_SIZE,
+    RELAY_AUTH_KEY,
+    RELAY_CA_CERT,
+    RELAY_PORT,
+    RELAY_TLS,
+    TCP_PORT,
+    UDP_PORT,
+)
+
+# 4-byte big-endian length prefix used by every TCP frame
+_FRAME_LEN = struct.Struct('!I')
+
+# Compact separators for outgoing JSON frames; the default ", "/": " only
+# add bytes to every frame.
+_json_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def _json_bytes(obj):
+    """Encode a control/presence message for the wire."""
+    return _json_encode(obj).encode('utf-8')
+
+
+def _action_frame(action, key):
+    """Build an encoder for the one-field presence action {action, key: value}.
+    Everything but the value is encoded once here; each call only encodes
+    the value itself."""
+    head = _json_bytes({"action": action, key: None})[:-len(b'null}')]
+
+    def encode(value):
+        return head + _json_bytes(value) + b'}'
+    return encode
+
+
+_PING_FRAME = _json_bytes({"action": "PING"})
+_NAME_UPDATE = _action_frame("NAME_UPDATE", "name")
+_ACCEPT_CONNECTION = _action_frame("ACCEPT_CONNECTION", "room")
+_ACCEPT_CONNECTION_BY_ID = _action_frame("ACCEPT_CONNECTION_BY_ID", "from_id")
+_REJECT_CONNECTION = _action_frame("REJECT_CONNECTION", "from_id")
+_CANCEL_CONNECTION = _action_frame("CANCEL_CONNECTION", "target_id")
+
+
+# Presence frames handed to presence_callback (anything else is ignored).
+# PRESENCE_UPDATE is by far the most frequent, so one set lookup replaces
+# walking an if/elif chain for every roster broadcast.
+_PRESENCE_FORWARD_TYPES = frozenset({
+    "PRESENCE_UPDATE",
+    "CONNECTION_REQUEST",
+    "CONNECT_ROOM",
+    "CONNECTION_REJECTED",
+    "CONNECTION_CANCELLED",
+    # Lobby join request/response
+    "JOIN_REQUEST",
+    "JOIN_RESPONSE",
+    "JOIN_REQUEST_FAILED",
+})
+
+
+def _tcp_socket():
+    """New TCP socket for control/presence traffic. Frames are small and
+    latency-sensitive, so Nagle is off — otherwise a frame sent while the
+    previous one is unacknowledged can sit behind a delayed ACK."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+# DSCP Expedited Forwarding (46) in the TOS byte — the standard marking for
+# voice, which Wi-Fi WMM and QoS-aware routers queue ahead of bulk traffic.
+_IP_TOS = getattr(socket, 'IP_TOS', None)
+_DSCP_EF = 46 << 2
+
+
+def _audio_udp_socket():
+    """New UDP socket for audio. The receive buffer is raised so a burst
+    that lands while the listener thread is stalled (GC, GIL contention)
+    queues in the kernel instead of being dropped; some platforms default
+    to only a few dozen KB. Outgoing packets are marked as voice (DSCP EF).
+    Both are best effort — the OS may clamp, ignore or refuse them."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, AUDIO_UDP_RCVBUF)
+    except OSError:
+        pass
+    if _IP_TOS is not None:
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, _IP_TOS, _DSCP_EF)
+        except OSError:
+            pass
+    return sock
+
+
+# On plain sockets MSG_WAITALL lets the kernel fill a whole frame in one
+# recv call, so a large transfer is read without dropping back into Python
+# (and retaking the GIL) for every segment. SSL sockets reject recv flags.
+_MSG_WAITALL = getattr(socket, 'MSG_WAITALL', 0)
+
+
+def _recv_into_exact(sock, view):
+    """Fill a writable memoryview completely from sock.
+    Returns False if the peer closes first."""
+    n = len(view)
+    flags = _MSG_WAITALL if type(sock) is socket.socket else 0
+    got = 0
+    while got < n:
+        r = sock.recv_into(view[got:], n - got, flags)
+        if not r:
+            return False
+        got += r
+    return True
+
+
+def _recv_exact(sock, n):
+    """Receive exactly n bytes into one preallocated bytearray.
+    Returns None if the peer closes first."""
+    buf = bytearray(n)
+    return buf if _recv_into_exact(sock, memoryview(buf)) else None
+
+
+class _FrameReader:
+    """Buffered length-prefixed frame reader for a listener's socket.
+
+    Each recv_into pulls in whatever has arrived — typically a header
+    together with its payload, or several small frames at once — and frames
+    are sliced out of one reusable buffer, so a burst of control/presence
+    traffic costs one syscall instead of two per frame. Payloads larger
+    than the buffer are received straight into their own bytearray.
+    """
+
+    def __init__(self, sock, size=BUFFER_SIZE * 16):
+        self._sock = sock
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._start = 0  # First unconsumed byte
+        self._end = 0    # End of received data
+
+    def _fill(self):
+        """Receive more data after what's buffered. Returns False on EOF."""
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self._buf):
+            # Buffer full with a partial frame at the tail — move it to the front
+            tail = self._end - self._start
+            self._buf[:tail] = self._view[self._start:self._end]
+            self._start, self._end = 0, tail
+        r = self._sock.recv_into(self._view[self._end:])
+        if not r:
+            return False
+        self._end += r
+        return True
+
+    def read_frame(self):
+        """Return the next frame's payload, or None if the socket closed.
+        Raises ValueError for a frame larger than MAX_FRAME_SIZE."""
+        while self._end - self._start < _FRAME_LEN.size:
+            if not self._fill():
+                return None
+        msg_len, = _FRAME_LEN.unpack_from(self._buf, self._start)
+        if msg_len > MAX_FRAME_SIZE:
+            raise ValueError(f"Rejecting oversized frame ({msg_len} bytes)")
+        self._start += _FRAME_LEN.size
+
+        if msg_len > len(self._buf):
+            # Too big to buffer: take what's here, receive the rest directly
+            out = bytearray(msg_len)
+            have = self._end - self._start
+            out[:have] = self._view[self._start:self._end]
+            self._start = self._end = 0
+            return out if _recv_into_exact(self._sock, memoryview(out)[have:]) else None
+
+        while self._end - self._start < msg_len:
+            if not self._fill():
+                return None
+        frame = bytes(self._view[self._start:self._start + msg_len])
+        self._start += msg_len
+        return frame
 
 
 class NetworkManager:
     def __init__(self, message_callback=None, audio_callback=None, log_callback=None):
         self.tcp_socket = None
-        self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.peer_ip = None
         self.peer_tcp_port = TCP_PORT  # Peer's TCP port (same as ours by default)
         self.peer_udp_port = UDP_PORT  # Peer's UDP port (same as ours by default)
@@ -26,11 +206,18 @@ class NetworkManager:
         # Incremented on each new connection so old _listen_tcp threads can detect they're stale
         self._conn_generation = 0
 
+        # Serializes frames on tcp_socket, so a file streamed in several
+        # writes can't interleave with control frames from other threads
+        self._tcp_send_lock = threading.Lock()
+        # Encoded '{"type":..,"payload":{},"timestamp":' (or null) per message type
+        self._bare_control_heads = {}
+
         # Relay mode state
         self.relay_mode = False
         self.relay_host = None
         self.relay_port = None
         self.relay_udp_socket = None  # Separate UDP socket for relay
+        self._relay_udp_addr = None  # Resolved (ip, port) of the relay's UDP side
         self.room_code = None
 
         # Presence state
@@ -41,6 +228,7 @@ class NetworkManager:
         self.user_id = None
         self._presence_auto_reconnect = False  # Set True after first successful connect
         self._presence_mode = "GREEN"
+        self._heartbeat_thread = None  # Started on first connect, reused across reconnects
 
         # LAN TLS (TOFU)
         self._lan_tls_context_server = None
@@ -51,21 +239,37 @@ class NetworkManager:
         self.tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.tcp_server.bind(('0.0.0.0', TCP_PORT))
-        self.tcp_server.listen(1)
-
-        self.udp_server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Room for a few simultaneous connection attempts (e.g. a peer
+        # retrying while another accept is mid-handshake) instead of refusing
+        self.tcp_server.listen(8)
+
+        # One UDP socket carries LAN audio both ways. Sharding the port with
+        # SO_REUSEPORT wouldn't help: a call is a single flow, so the kernel
+        # would hash it onto one socket anyway, and the option would let
+        # another process bind the port and take a share of our packets.
+        self.udp_server = _audio_udp_socket()
         self.udp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.udp_server.bind(('0.0.0.0', UDP_PORT))
 
+        # Control messages reach message_callback through one dispatcher
+        # thread, so a slow handler (e.g. writing a received voicemail to
+        # disk) never stalls reading the socket. Audio isn't queued:
+        # audio_callback is a cheap jitter-buffer push run on the RX thread.
+        self._msg_queue = queue.SimpleQueue()
+
         # Threads
+        threading.Thread(target=self._dispatch_messages, daemon=True).start()
         threading.Thread(target=self._accept_tcp, daemon=True).start()
         threading.Thread(target=self._listen_udp, daemon=True).start()
 
     def _log(self, msg):
+        # The app's log_callback already writes to the 'vox' logger; only
+        # fall back to it directly when there's no callback, so each line is
+        # formatted and queued once.
         if self.log_callback:
             self.log_callback(msg)
-        import logging
-        logging.getLogger('vox').info(msg)
+        else:
+            logging.getLogger('vox').info(msg)
 
     # ── TLS Setup ─────────────────────────────────────────────────
 
@@ -173,10 +377,11 @@ class NetworkManager:
             self._log(f"Already connected, skipping connect to {ip}")
             return True
         try:
-            raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            raw_sock.settimeout(5)
+            raw_sock = _tcp_socket()
+            # Keep the timeout through the TLS handshake so a dead or
+            # unresponsive peer can't stall the caller indefinitely.
+            raw_sock.settimeout(LAN_CONNECT_TIMEOUT)
             raw_sock.connect((ip, self.peer_tcp_port))
-            raw_sock.settimeout(None)
 
             # Wrap with TLS if available
             if self._lan_tls_context_client:
@@ -190,13 +395,15 @@ class NetworkManager:
                 except ssl.SSLError as e:
                     self._log(f"TLS failed with {ip}, falling back to plaintext: {e}")
                     raw_sock.close()
-                    raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    raw_sock = _tcp_socket()
+                    raw_sock.settimeout(LAN_CONNECT_TIMEOUT)
                     raw_sock.connect((ip, self.peer_tcp_port))
                     final_sock = raw_sock
                     self._log(f"Connected to {ip} (plaintext — peer may not support TLS)")
             else:
                 final_sock = raw_sock
                 self._log(f"Connected to {ip} (plaintext — no TLS certs)")
+            final_sock.settimeout(None)
 
             with self._conn_lock:
                 self.tcp_socket = final_sock
@@ -225,7 +432,7 @@ class NetworkManager:
 
         sock = None  # Local socket — not shared until handshake completes
         try:
-            raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            raw_sock = _tcp_socket()
             raw_sock.settimeout(10)
             raw_sock.connect((relay_host, relay_port))
 
@@ -234,7 +441,7 @@ class NetworkManager:
             sock.settimeout(None)
 
             # Send CREATE_ROOM handshake on the local socket
-            self._send_frame_on(sock, json.dumps({"action": "CREATE_ROOM", "auth_key": RELAY_AUTH_KEY}).encode('utf-8'))
+            self._send_frame_on(sock, _json_bytes({"action": "CREATE_ROOM", "auth_key": RELAY_AUTH_KEY}))
 
             # Read response
             response = self._read_frame_on(sock)
@@ -282,7 +489,7 @@ class NetworkManager:
 
         sock = None  # Local socket — not shared until handshake completes
         try:
-            raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            raw_sock = _tcp_socket()
             raw_sock.settimeout(10)
             raw_sock.connect((relay_host, relay_port))
 
@@ -291,11 +498,11 @@ class NetworkManager:
             sock.settimeout(None)
 
             # Send JOIN_ROOM handshake on the local socket
-            self._send_frame_on(sock, json.dumps({
+            self._send_frame_on(sock, _json_bytes({
                 "action": "JOIN_ROOM",
                 "room": self.room_code,
                 "auth_key": RELAY_AUTH_KEY
-            }).encode('utf-8'))
+            }))
 
             # Read response — may get "waiting" then "paired", or "paired" directly.
             # The relay may forward peer messages (TALK_START etc.) before sending
@@ -323,8 +530,7 @@ class NetworkManager:
                     self._register_udp_with_relay()
                     # Replay any early frames that arrived before "paired"
                     for early_msg in early_frames:
-                        if self.message_callback:
-                            self.message_callback(early_msg)
+                        self._post_message(early_msg)
                     threading.Thread(target=self._listen_tcp, args=(gen,), daemon=True).start()
                     threading.Thread(target=self._listen_relay_udp, daemon=True).start()
                     return True
@@ -383,16 +589,21 @@ class NetworkManager:
     def _register_udp_with_relay(self):
         """Set up a UDP socket for relay and register it with the server"""
         try:
-            self.relay_udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            # Resolve the relay once: sendto() with a hostname does a fresh
+            # name lookup for every audio packet.
+            self._relay_udp_addr = socket.getaddrinfo(
+                self.relay_host, self.relay_port, socket.AF_INET, socket.SOCK_DGRAM
+            )[0][4]
+            self.relay_udp_socket = _audio_udp_socket()
             self.relay_udp_socket.bind(('0.0.0.0', 0))  # Bind to any available port
             local_udp_port = self.relay_udp_socket.getsockname()[1]
 
             # Tell the relay our UDP port via TCP
-            reg_msg = json.dumps({"type": "UDP_REGISTER", "udp_port": local_udp_port})
-            self.send_tcp_data(reg_msg.encode('utf-8'))
+            reg_msg = _json_bytes({"type": "UDP_REGISTER", "udp_port": local_udp_port})
+            self.send_tcp_data(reg_msg)
 
             # Send a UDP packet to the relay to punch through NAT
-            self.relay_udp_socket.sendto(b"HELLO", (self.relay_host, self.relay_port))
+            self.relay_udp_socket.sendto(b"HELLO", self._relay_udp_addr)
 
             self._log(f"UDP registered with relay (local port {local_udp_port})")
         except Exception as e:
@@ -403,9 +614,12 @@ class NetworkManager:
         if not self.relay_udp_socket:
             return
         self._log("Listening for relay UDP audio...")
+        # Bind once: this loop runs per audio packet, and the sender address
+        # (always the relay) isn't needed, so recv() skips the addr tuple.
+        recv = self.relay_udp_socket.recv
         while self.running and self.relay_mode:
             try:
-                data, addr = self.relay_udp_socket.recvfrom(BUFFER_SIZE)
+                data = recv(BUFFER_SIZE)
                 if data == b"HELLO":
                     continue  # Ignore handshake packets
                 if self.audio_callback:
@@ -419,15 +633,15 @@ class NetworkManager:
 
     def _send_frame(self, data):
         """Send raw data with 4-byte length prefix (low-level)"""
-        msg_len = struct.pack('!I', len(data))
-        self.tcp_socket.sendall(msg_len + data)
+        with self._tcp_send_lock:
+            self._send_frame_on(self.tcp_socket, data)
 
     def _read_frame(self):
         """Read a length-prefixed frame from tcp_socket"""
-        raw_len = self._recv_all(4)
+        raw_len = self._recv_all(_FRAME_LEN.size)
         if not raw_len:
             return None
-        msg_len = struct.unpack('!I', raw_len)[0]
+        msg_len, = _FRAME_LEN.unpack(raw_len)
         if msg_len > MAX_FRAME_SIZE:
             self._log(f"Frame too large ({msg_len} bytes), rejecting")
             return None
@@ -444,14 +658,25 @@ class NetworkManager:
             self.connected = False
 
     def send_control(self, msg_type, payload=None):
-        """Send JSON control message via TCP"""
-        message = {
-            "type": msg_type,
-            "payload": payload,
-            "timestamp": time.time()
-        }
+        """Send JSON control message via TCP.
+        Messages with an empty or missing payload (TALK_START, TALK_STOP,
+        CALL_ENDED, ...) reuse a cached encoding of everything up to the
+        timestamp, so only the timestamp is formatted per send; the wire
+        format is unchanged."""
         try:
-            data = json.dumps(message).encode('utf-8')
+            if payload is None or payload == {}:
+                key = (msg_type, payload is None)
+                head = self._bare_control_heads.get(key)
+                if head is None:
+                    head = _json_bytes({"type": msg_type, "payload": payload})[:-1] + b',"timestamp":'
+                    self._bare_control_heads[key] = head
+                data = head + repr(time.time()).encode('ascii') + b'}'
+            else:
+                data = _json_bytes({
+                    "type": msg_type,
+                    "payload": payload,
+                    "timestamp": time.time()
+                })
             self.send_tcp_data(data)
         except Exception as e:
             self._log(f"Send Control Error: {e}")
@@ -461,31 +686,44 @@ class NetworkManager:
         try:
             if self.relay_mode and self.relay_udp_socket:
                 # Send to relay server, which forwards to peer
-                self.relay_udp_socket.sendto(audio_chunk, (self.relay_host, self.relay_port))
+                self.relay_udp_socket.sendto(audio_chunk, self._relay_udp_addr)
             elif self.peer_ip:
-                # Direct UDP to peer
-                self.udp_socket.sendto(audio_chunk, (self.peer_ip, self.peer_udp_port))
+                # Direct UDP to peer, from the same socket we receive on
+                self.udp_server.sendto(audio_chunk, (self.peer_ip, self.peer_udp_port))
         except Exception as e:
             self._log(f"Audio Send Error: {e}")
 
     def send_file(self, file_path):
-        """Send a file via TCP (for Voicemail)"""
+        """Send a file via TCP (for Voicemail).
+        The file goes out as one length-prefixed frame streamed straight from
+        disk with socket.sendfile — zero-copy on plain sockets, chunked sends
+        under TLS — rather than being read into memory first."""
         if not self.connected:
             return
 
         try:
             with open(file_path, 'rb') as f:
-                file_data = f.read()
+                size = os.fstat(f.fileno()).st_size
 
-            # 1. Send file header
-            import os
-            self.send_control("FILE_HEADER", {
-                "size": len(file_data),
-                "name": os.path.basename(file_path)
-            })
+                # 1. Send file header
+                self.send_control("FILE_HEADER", {
+                    "size": size,
+                    "name": os.path.basename(file_path)
+                })
 
-            # 2. Send raw file data
-            self.send_tcp_data(file_data)
+                # 2. Send raw file data
+                sock = self.tcp_socket
+                if not self.connected or not sock:
+                    return
+                try:
+                    with self._tcp_send_lock:
+                        sock.sendall(_FRAME_LEN.pack(size))
+                        sock.sendfile(f)
+                except Exception as e:
+                    # Same handling as send_tcp_data: a failed send drops the link
+                    self._log(f"TCP Send Error: {e}")
+                    self.connected = False
+                    return
 
             self._log("File sent successfully")
         except Exception as e:
@@ -493,20 +731,40 @@ class NetworkManager:
 
     # ── Receive / Listen ─────────────────────────────────────────
 
+    def _post_message(self, msg):
+        """Queue a control message for message_callback (any thread)."""
+        self._msg_queue.put(msg)
+
+    def _dispatch_messages(self):
+        """Deliver queued control messages to message_callback, in order."""
+        get = self._msg_queue.get
+        while True:
+            msg = get()
+            if msg is None:
+                break  # Sentinel from close()
+            callback = self.message_callback
+            if callback:
+                try:
+                    callback(msg)
+                except Exception as e:
+                    self._log(f"Message handler error: {e}")
+
     def _accept_tcp(self):
         """Listen for incoming TCP connections (direct/LAN mode) with TLS TOFU"""
         self._log(f"Listening on TCP {TCP_PORT}")
         while self.running:
             try:
                 client, addr = self.tcp_server.accept()
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
                 # Try TLS, but fall back to plaintext if it fails
                 if self._lan_tls_context_server:
                     # Peek at first byte to detect TLS (0x16 = TLS handshake)
                     try:
-                        client.settimeout(2)
+                        # The timeout also covers the TLS handshake, so a
+                        # peer that stalls can't hold up later accepts
+                        client.settimeout(LAN_CONNECT_TIMEOUT)
                         first_byte = client.recv(1, socket.MSG_PEEK)
-                        client.settimeout(None)
                         if first_byte and first_byte[0] == 0x16:
                             # Looks like TLS
                             try:
@@ -528,6 +786,7 @@ class NetworkManager:
                         self._log(f"Accepted connection from {addr} (timeout on peek, assuming plaintext)")
                 else:
                     self._log(f"Accepted plaintext connection from {addr}")
+                client.settimeout(None)
 
                 with self._conn_lock:
                     # Don't clobber an active relay connection with a LAN probe
@@ -557,8 +816,7 @@ class NetworkManager:
                 threading.Thread(target=self._listen_tcp, args=(gen,), daemon=True).start()
 
                 # Notify the app that a connection was accepted
-                if self.message_callback:
-                    self.message_callback({"type": "PEER_CONNECTED", "payload": {"ip": addr[0], "direction": "inbound"}})
+                self._post_message({"type": "PEER_CONNECTED", "payload": {"ip": addr[0], "direction": "inbound"}})
             except Exception as e:
                 if self.running:
                     self._log(f"Accept Error: {e}")
@@ -569,45 +827,36 @@ class NetworkManager:
             sock = self.tcp_socket
         if not sock:
             return None
-        data = b''
-        while len(data) < n:
-            packet = sock.recv(n - len(data))
-            if not packet:
-                return None
-            data += packet
-        return data
+        return _recv_exact(sock, n)
 
     def _listen_tcp(self, generation=None):
         """Receive Loop for Control Messages.
         If generation is provided, only mark disconnected if we're still on that generation
         (prevents stale threads from killing a newer connection)."""
-        while self.connected and self.tcp_socket:
+        # Bind to the socket this listener was started for, so per-frame
+        # reads go straight to it instead of taking _conn_lock twice per frame.
+        # A replaced socket is closed by its replacer, which ends this loop.
+        with self._conn_lock:
+            sock = self.tcp_socket
+        reader = _FrameReader(sock)
+        while self.connected and sock:
             try:
-                # 1. Read 4-byte Length
-                raw_len = self._recv_all(4)
-                if not raw_len:
-                    break
-
-                msg_len = struct.unpack('!I', raw_len)[0]
-
-                # Enforce frame size limit
-                if msg_len > MAX_FRAME_SIZE:
-                    self._log(f"Rejecting oversized frame ({msg_len} bytes)")
-                    break
-
-                # 2. Read Payload
-                payload = self._recv_all(msg_len)
+                # 1. Read length-prefixed frame (size limit enforced there)
+                payload = reader.read_frame()
                 if not payload:
                     break
 
-                # 3. Process — try JSON, fallback to binary
-                try:
-                    msg = json.loads(payload.decode('utf-8'))
-                    if self.message_callback:
-                        self.message_callback(msg)
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    if self.message_callback:
-                        self.message_callback({"type": "BINARY_DATA", "payload": payload})
+                # 2. Process — control frames are JSON objects; anything else
+                # (voicemail WAV data) is handed over as-is, without first
+                # paying a UTF-8 decode of the whole payload.
+                if payload[:1] == b'{':
+                    try:
+                        msg = json.loads(payload)
+                        self._post_message(msg)
+                        continue
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        pass
+                self._post_message({"type": "BINARY_DATA", "payload": payload})
 
             except Exception as e:
                 self._log(f"TCP Recv Error: {e}")
@@ -624,9 +873,10 @@ class NetworkManager:
     def _listen_udp(self):
         """Receive Loop for Audio (direct/LAN mode)"""
         self._log(f"Listening on UDP {UDP_PORT}")
+        recv = self.udp_server.recv  # Sender address is unused
         while self.running:
             try:
-                data, addr = self.udp_server.recvfrom(BUFFER_SIZE)
+                data = recv(BUFFER_SIZE)
                 if self.audio_callback and not self.relay_mode:
                     self.audio_callback(data)
             except Exception as e:
@@ -657,6 +907,7 @@ class NetworkManager:
 
     def close(self):
         self.running = False
+        self._msg_queue.put(None)
         self.disconnect()
         self.disconnect_presence()
         if self.tcp_server:
@@ -676,7 +927,7 @@ class NetworkManager:
         self._presence_team_ids = team_ids or []
 
         try:
-            raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            raw_sock = _tcp_socket()
             raw_sock.settimeout(10)
             raw_sock.connect((relay_host, relay_port))
 
@@ -685,14 +936,14 @@ class NetworkManager:
             self.presence_socket.settimeout(None)
 
             # Send REGISTER
-            reg_msg = json.dumps({
+            reg_msg = _json_bytes({
                 "action": "REGISTER",
                 "name": display_name,
                 "user_id": user_id,
                 "mode": mode,
                 "team_ids": self._presence_team_ids,
                 "auth_key": RELAY_AUTH_KEY,
-            }).encode('utf-8')
+            })
             self._send_frame_on(self.presence_socket, reg_msg)
 
             # Read response
@@ -704,7 +955,9 @@ class NetworkManager:
                     self._presence_auto_reconnect = True
                     self._log(f"Presence registered as {display_name}" + (" (TLS)" if RELAY_TLS else ""))
                     threading.Thread(target=self._listen_presence, daemon=True).start()
-                    threading.Thread(target=self._presence_heartbeat, daemon=True).start()
+                    if self._heartbeat_thread is None:
+                        self._heartbeat_thread = threading.Thread(target=self._presence_heartbeat, daemon=True)
+                        self._heartbeat_thread.start()
                     return True
 
             self._log("Presence registration failed")
@@ -733,7 +986,7 @@ class NetworkManager:
                 payload["room"] = room_code
             if team_ids is not None:
                 payload["team_ids"] = team_ids
-            msg = json.dumps(payload).encode('utf-8')
+            msg = _json_bytes(payload)
             self._send_frame_on(self.presence_socket, msg)
         except Exception as e:
             self._log(f"Presence mode update failed: {e}")
@@ -749,7 +1002,7 @@ class NetworkManager:
         if not self.presence_connected or not self.presence_socket:
             return
         try:
-            msg = json.dumps({"action": "NAME_UPDATE", "name": new_name}).encode('utf-8')
+            msg = _NAME_UPDATE(new_name)
             self._send_frame_on(self.presence_socket, msg)
         except Exception as e:
             self._log(f"Presence name update failed: {e}")
@@ -760,11 +1013,11 @@ class NetworkManager:
             self._log("Not connected to presence server")
             return
         try:
-            msg = json.dumps({
+            msg = _json_bytes({
                 "action": "CONNECT_TO",
                 "target_id": target_user_id,
                 "name": self.display_name
-            }).encode('utf-8')
+            })
             self._send_frame_on(self.presence_socket, msg)
             self._log(f"Connection request sent to user {target_user_id}")
         except Exception as e:
@@ -776,10 +1029,7 @@ class NetworkManager:
             self._log("Cannot accept: not connected to presence")
             return
         try:
-            msg = json.dumps({
-                "action": "ACCEPT_CONNECTION",
-                "room": room_code
-            }).encode('utf-8')
+            msg = _ACCEPT_CONNECTION(room_code)
             self._send_frame_on(self.presence_socket, msg)
             self._log(f"Sent ACCEPT_CONNECTION for room {room_code}")
         except Exception as e:
@@ -791,10 +1041,7 @@ class NetworkManager:
             self._log("Cannot accept by ID: not connected to presence")
             return
         try:
-            msg = json.dumps({
-                "action": "ACCEPT_CONNECTION_BY_ID",
-                "from_id": from_id
-            }).encode('utf-8')
+            msg = _ACCEPT_CONNECTION_BY_ID(from_id)
             self._send_frame_on(self.presence_socket, msg)
             self._log(f"Sent ACCEPT_CONNECTION_BY_ID for {from_id}")
         except Exception as e:
@@ -805,10 +1052,7 @@ class NetworkManager:
         if not self.presence_connected or not self.presence_socket:
             return
         try:
-            msg = json.dumps({
-                "action": "REJECT_CONNECTION",
-                "from_id": from_id
-            }).encode('utf-8')
+            msg = _REJECT_CONNECTION(from_id)
             self._send_frame_on(self.presence_socket, msg)
         except Exception as e:
             self._log(f"Reject connection failed: {e}")
@@ -819,7 +1063,7 @@ class NetworkManager:
             self._log("Cannot send presence message — not connected")
             return
         try:
-            data = json.dumps(msg_dict).encode('utf-8')
+            data = _json_bytes(msg_dict)
             self._send_frame_on(self.presence_socket, data)
         except Exception as e:
             self._log(f"Presence send failed: {e}")
@@ -829,10 +1073,7 @@ class NetworkManager:
         if not self.presence_connected or not self.presence_socket:
             return
         try:
-            msg = json.dumps({
-                "action": "CANCEL_CONNECTION",
-                "target_id": target_user_id or ""
-            }).encode('utf-8')
+            msg = _CANCEL_CONNECTION(target_user_id or "")
             self._send_frame_on(self.presence_socket, msg)
             self._log("Connection request cancelled")
         except Exception as e:
@@ -840,41 +1081,26 @@ class NetworkManager:
 
     def _listen_presence(self):
         """Listen for presence updates from the server"""
+        # The presence socket lives for the whole registration, so resolve it
+        # once; a reconnect starts a fresh listener bound to the new socket.
+        read_frame = _FrameReader(self.presence_socket).read_frame
         while self.running and self.presence_connected:
             try:
-                frame = self._read_frame_on(self.presence_socket)
+                frame = read_frame()
                 if frame is None:
                     break
 
-                msg = json.loads(frame.decode('utf-8'))
+                # json.loads takes the raw frame bytes directly
+                msg = json.loads(frame)
                 msg_type = msg.get("type")
 
-                if msg_type == "PRESENCE_UPDATE":
-                    if self.presence_callback:
-                        self.presence_callback(msg)
-
-                elif msg_type == "CONNECTION_REQUEST":
-                    # Incoming connection request from another user
-                    self._log(f"[Presence] Got CONNECTION_REQUEST: from={msg.get('from_name')} room={msg.get('room')}")
-                    if self.presence_callback:
-                        self.presence_callback(msg)
-
-                elif msg_type == "CONNECT_ROOM":
-                    # Server tells us to join a room for audio
-                    self._log(f"[Presence] Got CONNECT_ROOM: {msg}")
-                    if self.presence_callback:
-                        self.presence_callback(msg)
-
-                elif msg_type == "CONNECTION_REJECTED":
-                    if self.presence_callback:
-                        self.presence_callback(msg)
-
-                elif msg_type == "CONNECTION_CANCELLED":
-                    if self.presence_callback:
-                        self.presence_callback(msg)
-
-                elif msg_type in ("JOIN_REQUEST", "JOIN_RESPONSE", "JOIN_REQUEST_FAILED"):
-                    # Lobby join request/response — forward to main.py
+                if msg_type in _PRESENCE_FORWARD_TYPES:
+                    if msg_type == "CONNECTION_REQUEST":
+                        # Incoming connection request from another user
+                        self._log(f"[Presence] Got CONNECTION_REQUEST: from={msg.get('from_name')} room={msg.get('room')}")
+                    elif msg_type == "CONNECT_ROOM":
+                        # Server tells us to join a room for audio
+                        self._log(f"[Presence] Got CONNECT_ROOM: {msg}")
                     if self.presence_callback:
                         self.presence_callback(msg)
 
@@ -919,17 +1145,19 @@ class NetworkManager:
             self._log("Presence reconnection gave up")
 
     def _presence_heartbeat(self):
-        """Send periodic PING to relay so it can detect dead clients quickly."""
-        while self.running and self.presence_connected:
+        """Send periodic PING to relay so it can detect dead clients quickly.
+        One thread serves every presence connection and idles while
+        disconnected, so reconnects don't stack up extra heartbeat threads."""
+        while self.running:
             time.sleep(30)
-            if not self.presence_connected or not self.presence_socket:
-                break
+            sock = self.presence_socket
+            if not self.presence_connected or not sock:
+                continue
             try:
-                ping = json.dumps({"action": "PING"}).encode('utf-8')
-                self._send_frame_on(self.presence_socket, ping)
+                self._send_frame_on(sock, _PING_FRAME)
             except (OSError, ssl.SSLError):
+                # Socket dead, _listen_presence will handle reconnect
                 self._log("Presence heartbeat failed — socket dead")
-                break  # Socket dead, _listen_presence will handle reconnect
 
     def disconnect_presence(self):
         """Disconnect from the presence server (intentional — no auto-reconnect)"""
@@ -943,26 +1171,28 @@ class NetworkManager:
             self.presence_socket = None
 
     def _send_frame_on(self, sock, data):
-        """Send a length-prefixed frame on a specific socket"""
-        msg_len = struct.pack('!I', len(data))
-        sock.sendall(msg_len + data)
+        """Send a length-prefixed frame on a specific socket.
+        On plain sockets the prefix and payload go out as one sendmsg iovec,
+        so nothing is copied or allocated beyond the 4-byte prefix. TLS
+        sockets, and platforms without sendmsg (Windows), concatenate."""
+        prefix = _FRAME_LEN.pack(len(data))
+        if type(sock) is not socket.socket or not hasattr(sock, 'sendmsg'):
+            sock.sendall(prefix + data)
+            return
+        sent = sock.sendmsg([prefix, data])
+        if sent < len(data) + 4:  # Short write — finish the rest with sendall
+            if sent < 4:
+                sock.sendall(prefix[sent:])
+                sent = 4
+            sock.sendall(memoryview(data)[sent - 4:])
 
     def _read_frame_on(self, sock):
         """Read a length-prefixed frame from a specific socket"""
-        raw_len = b''
-        while len(raw_len) < 4:
-            chunk = sock.recv(4 - len(raw_len))
-            if not chunk:
-                return None
-            raw_len += chunk
-        msg_len = struct.unpack('!I', raw_len)[0]
+        raw_len = _recv_exact(sock, _FRAME_LEN.size)
+        if raw_len is None:
+            return None
+        msg_len, = _FRAME_LEN.unpack(raw_len)
         if msg_len > MAX_FRAME_SIZE:
             self._log(f"Rejecting oversized frame ({msg_len} bytes)")
             return None
-        data = b''
-        while len(data) < msg_len:
-            chunk = sock.recv(msg_len - len(data))
-            if not chunk:
-                return None
-            data += chunk
-        return data
+        return _recv_exact(sock, msg_len)
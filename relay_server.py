@@ -72,6 +72,7 @@ def cleanup_rate_limits():
 
 presence = {}          # user_id -> {"name": str, "mode": str, "team_ids": list, "sock": socket, "addr": tuple}
 presence_lock = threading.Lock()
+presence_seq = 0       # Bumped per broadcast; orders concurrent sends to a client
 
 def _normalize_team_ids(msg):
     """Accept both team_ids (list) and team_id (string) for backward compatibility."""
@@ -84,58 +85,84 @@ def _normalize_team_ids(msg):
 def broadcast_presence():
     """Send each client users from ALL their teams, grouped by team.
     Clients register with team_ids (list). Each client receives a
-    'teams' dict mapping team_id -> user list."""
-    dead_uids = []
-    with presence_lock:
-        # Build per-team user lists
-        team_users = {}  # team_id -> [user_info, ...]
-        for uid, info in presence.items():
-            for tid in info.get("team_ids", []):
-                entry = {
-                    "user_id": uid,
-                    "name": info["name"],
-                    "mode": info["mode"],
-                    "room": info.get("room", ""),
-                    "team_id": tid,
-                }
-                team_users.setdefault(tid, []).append(entry)
-
-        # Send each client their teams' users (grouped)
-        for uid, info in list(presence.items()):
-            client_team_ids = info.get("team_ids", [])
-            # Build grouped dict for this client
-            teams_dict = {}
-            flat_users = []
-            seen_uids = set()
-            for tid in client_team_ids:
-                teams_dict[tid] = team_users.get(tid, [])
-                for u in teams_dict[tid]:
-                    if u["user_id"] not in seen_uids:
-                        flat_users.append(u)
-                        seen_uids.add(u["user_id"])
-            msg = json.dumps({
-                "type": "PRESENCE_UPDATE",
-                "teams": teams_dict,
-                "users": flat_users,  # backward compat for old clients
-            }).encode('utf-8')
-            try:
-                send_frame(info["sock"], msg)
-            except Exception:
-                dead_uids.append(uid)
+    'teams' dict mapping team_id -> user list.
+    Frames are built under presence_lock but sent outside it, so a
+    backpressured client can't stall registrations or mode updates."""
+    global presence_seq
+    while True:
+        targets = []  # (uid, info, frame)
+        with presence_lock:
+            presence_seq += 1
+            seq = presence_seq
+            # Build per-team user lists
+            team_users = {}  # team_id -> [user_info, ...]
+            for uid, info in presence.items():
+                for tid in info.get("team_ids", []):
+                    entry = {
+                        "user_id": uid,
+                        "name": info["name"],
+                        "mode": info["mode"],
+                        "room": info.get("room", ""),
+                        "team_id": tid,
+                    }
+                    team_users.setdefault(tid, []).append(entry)
 
-    # Clean up dead clients outside the broadcast loop
-    if dead_uids:
+            # Build each client's view of their teams' users (grouped).
+            # Clients on the same set of teams see the same view, so each
+            # distinct team set is encoded into a wire frame only once.
+            frames = {}  # tuple(team_ids) -> length-prefixed frame
+            for uid, info in presence.items():
+                client_team_ids = tuple(info.get("team_ids", []))
+                frame = frames.get(client_team_ids)
+                if frame is None:
+                    teams_dict = {}
+                    flat_users = []
+                    seen_uids = set()
+                    for tid in client_team_ids:
+                        teams_dict[tid] = team_users.get(tid, [])
+                        for u in teams_dict[tid]:
+                            if u["user_id"] not in seen_uids:
+                                flat_users.append(u)
+                                seen_uids.add(u["user_id"])
+                    msg = json_bytes({
+                        "type": "PRESENCE_UPDATE",
+                        "teams": teams_dict,
+                        "users": flat_users,  # backward compat for old clients
+                    })
+                    frame = frames[client_team_ids] = _FRAME_LEN.pack(len(msg)) + msg
+                targets.append((uid, info, frame))
+
+        dead = []
+        for uid, info, frame in targets:
+            # Per-client lock + sequence number: concurrent broadcasts can't
+            # deliver an older snapshot after a newer one, and a client that
+            # already has this exact view is skipped
+            with info["send_lock"]:
+                if seq < info.get("sent_seq", 0) or frame == info.get("sent_frame"):
+                    continue
+                try:
+                    info["sock"].sendall(frame)
+                except Exception:
+                    dead.append((uid, info["sock"]))
+                    continue
+                info["sent_seq"] = seq
+                info["sent_frame"] = frame
+
+        if not dead:
+            return
+
+        # Clean up dead clients, then go round once more so the survivors
+        # see the cleaned list. Only remove entries that still hold the socket
+        # we failed on — the user may have re-registered meanwhile.
         with presence_lock:
-            for uid in dead_uids:
-                if uid in presence:
+            for uid, sock in dead:
+                if uid in presence and presence[uid]["sock"] is sock:
                     print(f"[Presence] Removing stale user: {uid}")
                     try:
-                        presence[uid]["sock"].close()
+                        sock.close()
                     except Exception:
                         pass
                     del presence[uid]
-        # Re-broadcast the cleaned list
-        broadcast_presence()
 
 def presence_sweep():
     """Periodically remove clients that haven't sent a PING recently."""
@@ -164,9 +191,23 @@ def presence_sweep():
         if dead:
             broadcast_presence()
 
-def handle_presence_client(client_sock, client_addr, user_id=None):
+def send_presence_json(info, obj):
+    """Send a JSON frame to a registered presence client, under its
+    send_lock so it can't interleave with a broadcast frame"""
+    with info["send_lock"]:
+        send_json(info["sock"], obj)
+
+def handle_presence_client(client_sock, client_addr, user_id=None, send_lock=None):
     """Handle a presence connection: register, then listen for updates"""
     print(f"[Presence] New connection from {client_addr}")
+    # Every write to this socket takes send_lock, so replies can't interleave
+    # with broadcast_presence frames sent from other threads
+    if send_lock is None:
+        send_lock = threading.Lock()
+
+    def reply(obj):
+        with send_lock:
+            send_json(client_sock, obj)
 
     try:
         # Set socket timeout so dead connections are detected
@@ -177,7 +218,7 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                 break
 
             try:
-                msg = json.loads(frame.decode('utf-8'))
+                msg = json.loads(frame)
             except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
 
@@ -196,12 +237,13 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                         "team_ids": team_ids,
                         "sock": client_sock,
                         "addr": client_addr,
+                        "send_lock": send_lock,
                         "registered_at": time.time(),
                         "last_ping": time.time(),
                     }
 
                 print(f"[Presence] Registered: {name} ({user_id}) teams={team_ids}")
-                send_json(client_sock, {"status": "registered", "user_id": user_id})
+                reply({"status": "registered", "user_id": user_id})
                 broadcast_presence()
 
             elif action == "PING":
@@ -209,7 +251,7 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                     if user_id and user_id in presence:
                         presence[user_id]["last_ping"] = time.time()
                 # Send PONG back so client knows connection is alive
-                send_json(client_sock, {"type": "PONG"})
+                reply({"type": "PONG"})
 
             elif action == "MODE_UPDATE":
                 mode = msg.get("mode", "GREEN")
@@ -246,12 +288,13 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                         rooms[room_code] = {
                             "clients": [],
                             "udp_addrs": [],
-                            "created": time.time()
+                            "created": time.time(),
+                            "paired": threading.Event(),  # Set when a second client joins
                         }
                     print(f"[Presence] {user_id} wants to connect to {target_id}, room: {room_code}")
 
                     # Tell the requester to join this room
-                    send_json(client_sock, {
+                    reply({
                         "type": "CONNECT_ROOM",
                         "room": room_code,
                         "role": "creator"
@@ -259,21 +302,21 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
 
                     # Tell the target they have an incoming request
                     try:
-                        send_json(target["sock"], {
+                        send_presence_json(target, {
                             "type": "CONNECTION_REQUEST",
                             "room": room_code,
                             "from_name": requester_name,
                             "from_id": user_id
                         })
                     except Exception:
-                        send_json(client_sock, {"type": "ERROR", "message": "Target user disconnected"})
+                        reply({"type": "ERROR", "message": "Target user disconnected"})
                 else:
-                    send_json(client_sock, {"type": "ERROR", "message": "User not found or offline"})
+                    reply({"type": "ERROR", "message": "User not found or offline"})
 
             elif action == "ACCEPT_CONNECTION":
                 room_code = msg.get("room")
                 if room_code:
-                    send_json(client_sock, {
+                    reply({
                         "type": "CONNECT_ROOM",
                         "room": room_code,
                         "role": "joiner"
@@ -289,11 +332,12 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                         rooms[room_code] = {
                             "clients": [],
                             "udp_addrs": [],
-                            "created": time.time()
+                            "created": time.time(),
+                            "paired": threading.Event(),  # Set when a second client joins
                         }
                     print(f"[Presence] ACCEPT_BY_ID: created room {room_code} for {user_id} <-> {from_id}")
                     # Tell the acceptor to join
-                    send_json(client_sock, {
+                    reply({
                         "type": "CONNECT_ROOM",
                         "room": room_code,
                         "role": "joiner"
@@ -303,7 +347,7 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                         caller = presence.get(from_id)
                     if caller:
                         try:
-                            send_json(caller["sock"], {
+                            send_presence_json(caller, {
                                 "type": "CONNECT_ROOM",
                                 "room": room_code,
                                 "role": "creator"
@@ -318,7 +362,7 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                         target = presence.get(target_id)
                     if target:
                         try:
-                            send_json(target["sock"], {
+                            send_presence_json(target, {
                                 "type": "CONNECTION_REJECTED",
                                 "message": "Connection declined"
                             })
@@ -333,7 +377,7 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                         target = presence.get(target_id)
                     if target:
                         try:
-                            send_json(target["sock"], {
+                            send_presence_json(target, {
                                 "type": "CONNECTION_CANCELLED",
                                 "message": "Call was cancelled"
                             })
@@ -353,7 +397,7 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
 
                 if admin:
                     try:
-                        send_json(admin["sock"], {
+                        send_presence_json(admin, {
                             "type": "JOIN_REQUEST",
                             "request_id": request_id,
                             "team_id": team_id,
@@ -363,12 +407,12 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
                         print(f"[Join] Routed request {request_id} from {user_id} to admin {admin_id}")
                     except Exception as e:
                         print(f"[Join] Could not notify admin: {e}")
-                        send_json(client_sock, {
+                        reply({
                             "type": "JOIN_REQUEST_FAILED",
                             "reason": "Could not reach team admin",
                         })
                 else:
-                    send_json(client_sock, {
+                    reply({
                         "type": "JOIN_REQUEST_FAILED",
                         "reason": "Team admin is not online",
                     })
@@ -384,7 +428,7 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
 
                 if requester:
                     try:
-                        send_json(requester["sock"], {
+                        send_presence_json(requester, {
                             "type": "JOIN_RESPONSE",
                             "request_id": request_id,
                             "approved": approved,
@@ -415,11 +459,38 @@ def handle_presence_client(client_sock, client_addr, user_id=None):
 rooms = {}          # room_code -> {"clients": [conn1, conn2], "udp_addrs": [addr1, addr2], "created": timestamp}
 rooms_lock = threading.Lock()
 
+# UDP forwarding table: sender (ip, port) -> tuple of peer addrs in its room.
+# Written only under rooms_lock, one room's entries at a time; udp_relay_loop
+# reads it without the lock (single dict lookups are atomic in CPython).
+udp_routes = {}
+
+def update_udp_routes(room, removed=()):
+    """Re-point udp_routes for one room's registered members, dropping any
+    addrs in removed first. Caller must hold rooms_lock."""
+    for a in removed:
+        if a:
+            udp_routes.pop(a, None)
+    addrs = [a for a in room["udp_addrs"] if a]
+    for a in addrs:
+        udp_routes[a] = tuple(p for p in addrs if p != a)
+
 def generate_room_code():
     """Generate a human-friendly room code like VOX-7X3KA2 (6 chars for brute-force resistance)"""
     suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
     return f"VOX-{suffix}"
 
+def wait_for_peer(room_code, timeout):
+    """Block until a second client joins room_code, without polling.
+    Returns that client's socket, or None on timeout / if the room is gone."""
+    with rooms_lock:
+        room = rooms.get(room_code)
+    if room is None or not room["paired"].wait(timeout):
+        return None
+    with rooms_lock:
+        if room_code in rooms and len(rooms[room_code]["clients"]) >= 2:
+            return rooms[room_code]["clients"][1]
+    return None
+
 def cleanup_stale_rooms(max_age=3600):
     """Remove rooms older than max_age seconds"""
     now = time.time()
@@ -433,39 +504,85 @@ def cleanup_stale_rooms(max_age=3600):
                     client.close()
                 except OSError:
                     pass
+            for addr in rooms[code]["udp_addrs"]:
+                if addr:
+                    udp_routes.pop(addr, None)
             del rooms[code]
 
 # ── TCP Framing ──────────────────────────────────────────────────
 
+_FRAME_LEN = struct.Struct('!I')
+
+# On plain sockets MSG_WAITALL lets the kernel fill a whole frame in one
+# recv call. SSL sockets reject recv flags and are read in a loop.
+_MSG_WAITALL = getattr(socket, 'MSG_WAITALL', 0)
+
 def recv_all(sock, n):
-    """Receive exactly n bytes"""
-    data = b''
-    while len(data) < n:
-        packet = sock.recv(n - len(data))
-        if not packet:
+    """Receive exactly n bytes into one preallocated bytearray"""
+    buf = bytearray(n)
+    view = memoryview(buf)
+    flags = _MSG_WAITALL if type(sock) is socket.socket else 0
+    got = 0
+    while got < n:
+        r = sock.recv_into(view[got:], n - got, flags)
+        if not r:
             return None
-        data += packet
-    return data
+        got += r
+    return buf
 
 def recv_frame(sock):
     """Receive a length-prefixed frame"""
     raw_len = recv_all(sock, 4)
     if not raw_len:
         return None
-    msg_len = struct.unpack('!I', raw_len)[0]
+    msg_len = _FRAME_LEN.unpack(raw_len)[0]
     if msg_len > 10 * 1024 * 1024:  # 10MB sanity limit
         return None
     payload = recv_all(sock, msg_len)
     return payload
 
+# Relay replies and presence broadcasts are encoded without the spaces
+# json.dumps puts after "," and ":"
+_json_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+def json_bytes(obj):
+    """Encode a control/presence message for the wire"""
+    return _json_encode(obj).encode('utf-8')
+
 def send_frame(sock, data):
-    """Send a length-prefixed frame"""
-    msg_len = struct.pack('!I', len(data))
-    sock.sendall(msg_len + data)
+    """Send a length-prefixed frame.
+    Plain sockets get the prefix and payload as one iovec, so relayed frames
+    aren't copied just to prepend four bytes. TLS sockets, and platforms
+    without sendmsg (Windows), still concatenate."""
+    msg_len = _FRAME_LEN.pack(len(data))
+    if type(sock) is not socket.socket or not hasattr(sock, 'sendmsg'):
+        sock.sendall(msg_len + data)
+        return
+    total = len(data) + 4
+    sent = sock.sendmsg([msg_len, data])
+    if sent < total:  # Short write — finish the rest with sendall
+        if sent < 4:
+            sock.sendall(msg_len[sent:])
+            sent = 4
+        sock.sendall(memoryview(data)[sent - 4:])
 
 def send_json(sock, obj):
     """Send a JSON object as a length-prefixed frame"""
-    send_frame(sock, json.dumps(obj).encode('utf-8'))
+    send_frame(sock, json_bytes(obj))
+
+def parse_udp_register(frame):
+    """Return the message dict if frame is a UDP_REGISTER, else None.
+    Most relayed frames aren't JSON at all, so a byte check rules them out
+    before paying for a decode + parse."""
+    if frame[:1] != b'{' or b'UDP_REGISTER' not in frame:
+        return None
+    try:
+        msg = json.loads(frame)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if isinstance(msg, dict) and msg.get("type") == "UDP_REGISTER":
+        return msg
+    return None
 
 # ── Room Relay (existing) ────────────────────────────────────────
 
@@ -484,7 +601,7 @@ def handle_room_client(client_sock, client_addr, udp_sock):
             return
 
         try:
-            msg = json.loads(handshake_data.decode('utf-8'))
+            msg = json.loads(handshake_data)
         except (json.JSONDecodeError, UnicodeDecodeError):
             send_json(client_sock, {"status": "error", "message": "Invalid handshake"})
             client_sock.close()
@@ -498,21 +615,15 @@ def handle_room_client(client_sock, client_addr, udp_sock):
                 rooms[room_code] = {
                     "clients": [client_sock],
                     "udp_addrs": [None, None],
-                    "created": time.time()
+                    "created": time.time(),
+                    "paired": threading.Event(),  # Set when a second client joins
                 }
             my_index = 0
             send_json(client_sock, {"status": "created", "room": room_code})
             print(f"[Room] Created: {room_code}")
 
             # Wait for peer
-            timeout = 300
-            start = time.time()
-            while time.time() - start < timeout:
-                with rooms_lock:
-                    if room_code in rooms and len(rooms[room_code]["clients"]) == 2:
-                        peer_sock = rooms[room_code]["clients"][1]
-                        break
-                time.sleep(0.5)
+            peer_sock = wait_for_peer(room_code, 300)
 
             if not peer_sock:
                 send_json(client_sock, {"status": "timeout"})
@@ -545,6 +656,8 @@ def handle_room_client(client_sock, client_addr, udp_sock):
                 rooms[room_code]["clients"].append(client_sock)
                 rooms[room_code]["udp_addrs"].append(None)
                 my_index = len(rooms[room_code]["clients"]) - 1
+                if my_index >= 1:
+                    rooms[room_code]["paired"].set()
                 num_clients = len(rooms[room_code]["clients"])
 
             if num_clients >= 2:
@@ -555,14 +668,7 @@ def handle_room_client(client_sock, client_addr, udp_sock):
                 # First client — wait for second
                 send_json(client_sock, {"status": "waiting", "room": room_code})
                 print(f"[Room] {room_code}: First client waiting...")
-                timeout = 120
-                start = time.time()
-                while time.time() - start < timeout:
-                    with rooms_lock:
-                        if room_code in rooms and len(rooms[room_code]["clients"]) >= 2:
-                            break
-                    time.sleep(0.5)
-                else:
+                if not wait_for_peer(room_code, 120):
                     send_json(client_sock, {"status": "timeout"})
                     with rooms_lock:
                         if room_code in rooms:
@@ -585,17 +691,17 @@ def handle_room_client(client_sock, client_addr, udp_sock):
                 break
 
             # Check for UDP registration
-            try:
-                check = json.loads(frame.decode('utf-8'))
-                if check.get("type") == "UDP_REGISTER":
-                    udp_port = check.get("udp_port")
-                    with rooms_lock:
-                        if room_code in rooms and my_index < len(rooms[room_code]["udp_addrs"]):
-                            rooms[room_code]["udp_addrs"][my_index] = (client_addr[0], udp_port)
-                    print(f"[UDP] Registered {client_addr[0]}:{udp_port} for {room_code}")
-                    continue
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
+            check = parse_udp_register(frame)
+            if check is not None:
+                udp_port = check.get("udp_port")
+                with rooms_lock:
+                    if room_code in rooms and my_index < len(rooms[room_code]["udp_addrs"]):
+                        room = rooms[room_code]
+                        old_addr = room["udp_addrs"][my_index]
+                        room["udp_addrs"][my_index] = (client_addr[0], udp_port)
+                        update_udp_routes(room, removed=(old_addr,))
+                print(f"[UDP] Registered {client_addr[0]}:{udp_port} for {room_code}")
+                continue
 
             # Broadcast frame to all other clients in room
             with rooms_lock:
@@ -620,11 +726,13 @@ def handle_room_client(client_sock, client_addr, udp_sock):
         if room_code:
             with rooms_lock:
                 if room_code in rooms:
+                    room = rooms[room_code]
+                    gone = ()
                     # Remove only this client, not entire room
                     try:
-                        idx = rooms[room_code]["clients"].index(client_sock)
-                        rooms[room_code]["clients"].pop(idx)
-                        rooms[room_code]["udp_addrs"].pop(idx)
+                        idx = room["clients"].index(client_sock)
+                        room["clients"].pop(idx)
+                        gone = (room["udp_addrs"].pop(idx),)
                     except (ValueError, IndexError):
                         pass
                     # Delete room if empty
@@ -633,45 +741,68 @@ def handle_room_client(client_sock, client_addr, udp_sock):
                         print(f"[Room] {room_code}: Empty, removed")
                     else:
                         print(f"[Room] {room_code}: Client left, {len(rooms[room_code]['clients'])} remaining")
+                    update_udp_routes(room, removed=gone)
 
 # ── UDP Relay ────────────────────────────────────────────────────
 
+UDP_SOCK_BUF = 1024 * 1024  # Kernel buffers sized to absorb bursts from many rooms
+
 def udp_relay_loop(udp_sock):
     """Receive UDP packets and forward to ALL other peers in the room"""
+    # Receive into one reusable buffer and forward a view of it, so no
+    # per-packet bytes object is allocated
+    buf = bytearray(8192)
+    view = memoryview(buf)
+    recvfrom_into = udp_sock.recvfrom_into
+    sendto = udp_sock.sendto
     while True:
         try:
-            data, addr = udp_sock.recvfrom(8192)
-            with rooms_lock:
-                for code, room in rooms.items():
-                    udp_addrs = room["udp_addrs"]
-                    # Find which index sent this packet
-                    sender_idx = None
-                    for i, a in enumerate(udp_addrs):
-                        if a and a == addr:
-                            sender_idx = i
-                            break
-                    if sender_idx is not None:
-                        # Forward to ALL other members in room
-                        for i, a in enumerate(udp_addrs):
-                            if a and i != sender_idx:
-                                udp_sock.sendto(data, a)
-                        break
+            n, addr = recvfrom_into(buf)
+            for peer in udp_routes.get(addr, ()):
+                sendto(view[:n], peer)
         except OSError as e:
             print(f"[UDP] Socket error: {e}")
 
 # ── TCP Router ───────────────────────────────────────────────────
 
+HANDSHAKE_TIMEOUT = 10  # seconds for TLS handshake + first frame
+MAX_CLIENTS = 1024      # Concurrent client connections (one thread each)
+
+# Presence clients hold their connection (and thread) for as long as the
+# app is open, so a fixed worker pool would starve new connections. Instead
+# each connection takes a slot, and accepts beyond the cap are refused.
+client_slots = threading.BoundedSemaphore(MAX_CLIENTS)
+
+def serve_client(client_sock, client_addr, udp_sock):
+    """Run handle_client, then give back the connection slot."""
+    try:
+        handle_client(client_sock, client_addr, udp_sock)
+    finally:
+        client_slots.release()
+
 def handle_client(client_sock, client_addr, udp_sock):
     """Route client to presence or room handler based on first message"""
     try:
+        # Bound the TLS handshake and the first frame, so a client that
+        # connects and goes quiet doesn't pin this thread forever
+        client_sock.settimeout(HANDSHAKE_TIMEOUT)
+        if isinstance(client_sock, ssl.SSLSocket):
+            try:
+                client_sock.do_handshake()
+            except (ssl.SSLError, OSError) as e:
+                print(f"[TLS] Handshake failed from {client_addr}: {e}")
+                client_sock.close()
+                return
+
         # Peek at the first frame to determine the channel
         frame = recv_frame(client_sock)
+        client_sock.settimeout(None)
         if not frame:
             client_sock.close()
             return
 
         try:
-            msg = json.loads(frame.decode('utf-8'))
+            msg = json.loads(frame)
         except (json.JSONDecodeError, UnicodeDecodeError):
             client_sock.close()
             return
@@ -693,21 +824,24 @@ def handle_client(client_sock, client_addr, udp_sock):
             mode = msg.get("mode", "GREEN")
             team_ids = _normalize_team_ids(msg)
 
+            send_lock = threading.Lock()
             with presence_lock:
                 presence[user_id] = {
                     "name": name,
                     "mode": mode,
                     "team_ids": team_ids,
                     "sock": client_sock,
-                    "addr": client_addr
+                    "addr": client_addr,
+                    "send_lock": send_lock,
                 }
 
             print(f"[Presence] Registered: {name} ({user_id})")
-            send_json(client_sock, {"status": "registered", "user_id": user_id})
+            with send_lock:
+                send_json(client_sock, {"status": "registered", "user_id": user_id})
             broadcast_presence()
 
             # Continue handling presence messages (pass user_id for cleanup)
-            handle_presence_client(client_sock, client_addr, user_id)
+            handle_presence_client(client_sock, client_addr, user_id, send_lock)
             # Note: handle_presence_client will handle cleanup
             return
 
@@ -755,20 +889,14 @@ def handle_room_client_with_handshake(client_sock, client_addr, udp_sock, handsh
                 rooms[room_code] = {
                     "clients": [client_sock],
                     "udp_addrs": [None, None],
-                    "created": time.time()
+                    "created": time.time(),
+                    "paired": threading.Event(),  # Set when a second client joins
                 }
             my_index = 0
             send_json(client_sock, {"status": "created", "room": room_code})
             print(f"[Room] Created: {room_code}")
 
-            timeout = 300
-            start = time.time()
-            while time.time() - start < timeout:
-                with rooms_lock:
-                    if room_code in rooms and len(rooms[room_code]["clients"]) == 2:
-                        peer_sock = rooms[room_code]["clients"][1]
-                        break
-                time.sleep(0.5)
+            peer_sock = wait_for_peer(room_code, 300)
 
             if not peer_sock:
                 send_json(client_sock, {"status": "timeout"})
@@ -801,6 +929,8 @@ def handle_room_client_with_handshake(client_sock, client_addr, udp_sock, handsh
                 rooms[room_code]["clients"].append(client_sock)
                 rooms[room_code]["udp_addrs"].append(None)
                 my_index = len(rooms[room_code]["clients"]) - 1
+                if my_index >= 1:
+                    rooms[room_code]["paired"].set()
 
                 if len(rooms[room_code]["clients"]) == 2:
                     peer_sock = rooms[room_code]["clients"][0]
@@ -813,14 +943,7 @@ def handle_room_client_with_handshake(client_sock, client_addr, udp_sock, handsh
             else:
                 send_json(client_sock, {"status": "waiting", "room": room_code})
                 print(f"[Room] {room_code}: First client waiting...")
-                timeout = 120
-                start = time.time()
-                while time.time() - start < timeout:
-                    with rooms_lock:
-                        if room_code in rooms and len(rooms[room_code]["clients"]) == 2:
-                            peer_sock = rooms[room_code]["clients"][1]
-                            break
-                    time.sleep(0.5)
+                peer_sock = wait_for_peer(room_code, 120)
 
                 if not peer_sock:
                     send_json(client_sock, {"status": "timeout"})
@@ -838,16 +961,16 @@ def handle_room_client_with_handshake(client_sock, client_addr, udp_sock, handsh
             frame = recv_frame(client_sock)
             if frame is None:
                 break
-            try:
-                check = json.loads(frame.decode('utf-8'))
-                if check.get("type") == "UDP_REGISTER":
-                    udp_port = check.get("udp_port")
-                    with rooms_lock:
-                        if room_code in rooms:
-                            rooms[room_code]["udp_addrs"][my_index] = (client_addr[0], udp_port)
-                    continue
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
+            check = parse_udp_register(frame)
+            if check is not None:
+                udp_port = check.get("udp_port")
+                with rooms_lock:
+                    if room_code in rooms:
+                        room = rooms[room_code]
+                        old_addr = room["udp_addrs"][my_index]
+                        room["udp_addrs"][my_index] = (client_addr[0], udp_port)
+                        update_udp_routes(room, removed=(old_addr,))
+                continue
 
             # Broadcast to all peers in room (not just peer_sock)
             with rooms_lock:
@@ -872,10 +995,12 @@ def handle_room_client_with_handshake(client_sock, client_addr, udp_sock, handsh
         if room_code:
             with rooms_lock:
                 if room_code in rooms:
+                    room = rooms[room_code]
+                    gone = ()
                     try:
-                        idx = rooms[room_code]["clients"].index(client_sock)
-                        rooms[room_code]["clients"].pop(idx)
-                        rooms[room_code]["udp_addrs"].pop(idx)
+                        idx = room["clients"].index(client_sock)
+                        room["clients"].pop(idx)
+                        gone = (room["udp_addrs"].pop(idx),)
                     except (ValueError, IndexError):
                         pass
                     if len(rooms[room_code]["clients"]) == 0:
@@ -883,6 +1008,7 @@ def handle_room_client_with_handshake(client_sock, client_addr, udp_sock, handsh
                         print(f"[Room] {room_code}: Empty, removed")
                     else:
                         print(f"[Room] {room_code}: Client left, {len(rooms[room_code]['clients'])} remaining")
+                    update_udp_routes(room, removed=gone)
 
 # ── TLS Setup ───────────────────────────────────────────────────
 
@@ -927,12 +1053,21 @@ def main():
     tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     tcp_server.bind((args.host, args.port))
-    tcp_server.listen(20)
+    # Deep accept backlog so a reconnect burst (e.g. after a relay restart)
+    # queues in the kernel instead of being dropped. Presence and rooms live
+    # in this process, so there is deliberately no SO_REUSEPORT multi-worker
+    # mode — clients on different workers couldn't see or reach each other.
+    tcp_server.listen(min(1024, socket.SOMAXCONN))
     print(f"[Server] Vox Relay listening on {args.host}:{args.port}")
     print("[Server] Presence + Room relay active")
 
     udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    for opt in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+        try:
+            udp_sock.setsockopt(socket.SOL_SOCKET, opt, UDP_SOCK_BUF)
+        except OSError:
+            pass  # Kernel caps (net.core.rmem_max / wmem_max) apply anyway
     udp_sock.bind((args.host, args.port))
 
     threading.Thread(target=udp_relay_loop, args=(udp_sock,), daemon=True).start()
@@ -949,15 +1084,26 @@ def main():
     try:
         while True:
             client_sock, client_addr = tcp_server.accept()
-            # Wrap with TLS if enabled
+            if not client_slots.acquire(blocking=False):
+                print(f"[Server] At {MAX_CLIENTS} connections — refusing {client_addr}")
+                client_sock.close()
+                continue
+            # Small control/presence frames and relayed frames go out as
+            # soon as they're written, not held back by Nagle
+            client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Wrap with TLS if enabled. The handshake itself runs on the
+            # client's thread (handle_client), so a slow or stalled client
+            # can't hold up accept() for everyone else.
             if tls_context:
                 try:
-                    client_sock = tls_context.wrap_socket(client_sock, server_side=True)
-                except ssl.SSLError as e:
-                    print(f"[TLS] Handshake failed from {client_addr}: {e}")
+                    client_sock = tls_context.wrap_socket(
+                        client_sock, server_side=True, do_handshake_on_connect=False)
+                except (ssl.SSLError, OSError) as e:
+                    print(f"[TLS] Setup failed for {client_addr}: {e}")
                     client_sock.close()
+                    client_slots.release()
                     continue
-            threading.Thread(target=handle_client, args=(client_sock, client_addr, udp_sock), daemon=True).start()
+            threading.Thread(target=serve_client, args=(client_sock, client_addr, udp_sock), daemon=True).start()
     except KeyboardInterrupt:
         print("\n[Server] Shutting down...")
     finally:
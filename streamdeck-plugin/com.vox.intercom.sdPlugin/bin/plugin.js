@@ -51,6 +51,21 @@ let talkAction, modeAction, teamAction, userAction, logoAction, panelAction;
 
 // ── SVG rendering ───────────────────────────────────────────
 
+// Contrast text colour per background — the palette is fixed, so each
+// colour is parsed once rather than on every redraw.
+const textColorCache = new Map();
+
+function textColorFor(bgColor) {
+    let textColor = textColorCache.get(bgColor);
+    if (textColor === undefined) {
+        const r = parseInt(bgColor.slice(1, 3), 16);
+        const g = parseInt(bgColor.slice(3, 5), 16);
+        textColor = (r > 128 && g > 128) ? "#000" : "#fff";
+        textColorCache.set(bgColor, textColor);
+    }
+    return textColor;
+}
+
 function renderSVG(bgColor, lines, fontSize) {
     fontSize = fontSize || 26;
     const w = 144, h = 144;
@@ -58,10 +73,7 @@ function renderSVG(bgColor, lines, fontSize) {
     const totalHeight = lines.length * lineHeight;
     const startY = (h - totalHeight) / 2 + fontSize;
 
-    const r = parseInt(bgColor.slice(1, 3), 16);
-    const g = parseInt(bgColor.slice(3, 5), 16);
-    const b = parseInt(bgColor.slice(5, 7), 16);
-    const textColor = (r > 128 && g > 128) ? "#000" : "#fff";
+    const textColor = textColorFor(bgColor);
 
     let textEls = "";
     lines.forEach((line, i) => {
@@ -76,18 +88,40 @@ function renderSVG(bgColor, lines, fontSize) {
         + textEls + `</svg>`;
 }
 
+// The logo SVG embeds the whole base64 PNG, and the message pulse redraws
+// it every 1.2s, so it's built once and reused.
+let voxLogoSvg = null;
+
 function renderVoxLogo() {
+    if (voxLogoSvg) return voxLogoSvg;
     const w = 144, h = 144;
     const imgW = 128, imgH = 120;
     const ix = (w - imgW) / 2, iy = (h - imgH) / 2;
-    return `<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="${w}" height="${h}">`
+    voxLogoSvg = `<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="${w}" height="${h}">`
         + `<rect width="${w}" height="${h}" fill="${COLOR_OFF}"/>`
         + `<image x="${ix}" y="${iy}" width="${imgW}" height="${imgH}" href="data:image/png;base64,${VOX_LOGO_B64}"/>`
         + `</svg>`;
+    return voxLogoSvg;
 }
 
+// Keys cycle through a handful of distinct images, so encoded data URLs are
+// kept in a small LRU (Map iteration order = least recently used first).
+const SVG_URL_CACHE_MAX = 64;
+const svgUrlCache = new Map();
+
 function svgDataUrl(svg) {
-    return "data:image/svg+xml;charset=utf8," + encodeURIComponent(svg);
+    let url = svgUrlCache.get(svg);
+    if (url !== undefined) {
+        svgUrlCache.delete(svg);
+        svgUrlCache.set(svg, url);
+        return url;
+    }
+    url = "data:image/svg+xml;charset=utf8," + encodeURIComponent(svg);
+    svgUrlCache.set(svg, url);
+    if (svgUrlCache.size > SVG_URL_CACHE_MAX) {
+        svgUrlCache.delete(svgUrlCache.keys().next().value);
+    }
+    return url;
 }
 
 function truncName(name, max) {
@@ -103,15 +137,26 @@ function escapeXml(s) {
 
 // ── Helpers to push images to all visible instances of an action ──
 
+// Last image sent to each key (by action instance id). State broadcasts
+// often re-assert what's already shown, so unchanged keys are skipped
+// rather than pushed to the device again.
+const keyImages = new Map();
+
 function setAllImages(actionInstance, svg) {
     const url = svgDataUrl(svg);
     for (const a of actionInstance.actions) {
-        if (a.isKey()) {
+        if (a.isKey() && keyImages.get(a.id) !== url) {
+            keyImages.set(a.id, url);
             a.setImage(url);
         }
     }
 }
 
+// A key that (re)appears shows its default image until told otherwise
+function forgetKeyImage(ev) {
+    keyImages.delete(ev.action.id);
+}
+
 // ── Per-action refresh logic ────────────────────────────────
 
 function refreshTalk() {
@@ -305,37 +350,43 @@ function sendToVox(msg) {
 // ── Action classes ──────────────────────────────────────────
 
 class TalkAction extends SingletonAction {
-    onWillAppear() { refreshTalk(); }
+    onWillAppear(ev) { forgetKeyImage(ev); refreshTalk(); }
+    onWillDisappear(ev) { forgetKeyImage(ev); }
     onKeyDown() { sendToVox({ action: "ptt_press" }); }
     onKeyUp() { sendToVox({ action: "ptt_release" }); }
 }
 TalkAction.prototype.manifestId = "com.vox.intercom.talk";
 
 class ModeAction extends SingletonAction {
-    onWillAppear() { refreshMode(); }
+    onWillAppear(ev) { forgetKeyImage(ev); refreshMode(); }
+    onWillDisappear(ev) { forgetKeyImage(ev); }
     onKeyDown() { sendToVox({ action: "cycle_mode" }); }
 }
 ModeAction.prototype.manifestId = "com.vox.intercom.mode";
 
 class TeamAction extends SingletonAction {
-    onWillAppear() { refreshTeam(); }
+    onWillAppear(ev) { forgetKeyImage(ev); refreshTeam(); }
+    onWillDisappear(ev) { forgetKeyImage(ev); }
     onKeyDown() { sendToVox({ action: "cycle_team" }); }
 }
 TeamAction.prototype.manifestId = "com.vox.intercom.team";
 
 class UserAction extends SingletonAction {
-    onWillAppear() { refreshUser(); }
+    onWillAppear(ev) { forgetKeyImage(ev); refreshUser(); }
+    onWillDisappear(ev) { forgetKeyImage(ev); }
     onKeyDown() { sendToVox({ action: "cycle_user" }); }
 }
 UserAction.prototype.manifestId = "com.vox.intercom.user";
 
 class LogoAction extends SingletonAction {
-    onWillAppear() { refreshLogo(); }
+    onWillAppear(ev) { forgetKeyImage(ev); refreshLogo(); }
+    onWillDisappear(ev) { forgetKeyImage(ev); }
 }
 LogoAction.prototype.manifestId = "com.vox.intercom.logo";
 
 class PanelAction extends SingletonAction {
-    onWillAppear() { refreshPanel(); }
+    onWillAppear(ev) { forgetKeyImage(ev); refreshPanel(); }
+    onWillDisappear(ev) { forgetKeyImage(ev); }
     onKeyDown() { sendToVox({ action: "show_panel" }); }
 }
 PanelAction.prototype.manifestId = "com.vox.intercom.panel";
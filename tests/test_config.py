@@ -160,3 +160,16 @@ def test_relay_auth_key_default():
     import config
     assert config.RELAY_AUTH_KEY is not None
     assert len(config.RELAY_AUTH_KEY) > 0
+
+
+def test_cached_time_formatter_reuses_timestamp_within_second():
+    """Records in the same second share a timestamp; a new second reformats."""
+    import config
+    fmt = config._CachedTimeFormatter('%(asctime)s', datefmt='%H:%M:%S')
+    rec = logging.LogRecord('vox', logging.INFO, __file__, 1, 'msg', None, None)
+    rec.created = 1000.1
+    first = fmt.formatTime(rec, fmt.datefmt)
+    rec.created = 1000.9
+    assert fmt.formatTime(rec, fmt.datefmt) is first
+    rec.created = 1001.0
+    assert fmt.formatTime(rec, fmt.datefmt) != first
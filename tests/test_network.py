@@ -1,14 +1,21 @@
 """Tests for network protocol logic — TLS context creation, relay message
-format validation, presence message serialization, and UDP packet framing.
+format validation, presence message serialization, and UDP and TCP packet
+framing.
 
 All tests are self-contained and use mocks — no real network calls.
 """
 
 import json
+import socket
 import ssl
 import struct
+import threading
 from unittest.mock import MagicMock
 
+import pytest
+
+from network_manager import NetworkManager, _action_frame, _FrameReader, _recv_exact
+
 # ── TLS context creation ─────────────────────────────────────────
 
 class TestRelayTLSContext:
@@ -224,3 +231,165 @@ class TestUDPPacketFraming:
         mock_sock.sendall(msg_len + data)
 
         mock_sock.sendall.assert_called_once_with(expected_len + data)
+
+
+# ── TCP framing ──────────────────────────────────────────────────
+
+def _frame(data):
+    return struct.pack("!I", len(data)) + data
+
+
+class TestTCPFraming:
+    """Test length-prefixed TCP framing on the send and receive paths."""
+
+    @pytest.fixture
+    def nm(self):
+        """A NetworkManager with only the state the framing paths touch."""
+        nm = NetworkManager.__new__(NetworkManager)
+        nm._tcp_send_lock = threading.Lock()
+        nm._bare_control_heads = {}
+        nm.log_callback = lambda msg: None
+        nm.connected = True
+        return nm
+
+    def test_send_frame_on_concatenates_once_without_sendmsg(self, nm):
+        """Sockets without a plain sendmsg (TLS, Windows) get one sendall per frame."""
+        mock_sock = MagicMock()
+
+        data = b'{"type": "PING"}'
+        nm._send_frame_on(mock_sock, data)
+
+        mock_sock.sendall.assert_called_once_with(_frame(data))
+        mock_sock.sendmsg.assert_not_called()
+
+    def test_send_frame_on_plain_socket_sends_frames_intact(self, nm):
+        """Small and large frames sent as an iovec should arrive intact on the wire."""
+        small = b'{"type": "PING"}'
+        large = bytes(range(256)) * 4
+        a, b = socket.socketpair()
+        try:
+            nm._send_frame_on(a, small)
+            nm._send_frame_on(a, large)
+            a.close()
+            wire = b""
+            while chunk := b.recv(4096):
+                wire += chunk
+        finally:
+            b.close()
+
+        assert wire == _frame(small) + _frame(large)
+
+    def test_recv_exact_reassembles_split_payload(self):
+        """_recv_exact should fill one buffer across short reads and stop on EOF."""
+        a, b = socket.socketpair()
+        try:
+            a.sendall(b"hello ")
+            a.sendall(b"world")
+            assert _recv_exact(b, 11) == b"hello world"
+            a.sendall(b"abc")
+            a.close()
+            assert _recv_exact(b, 5) is None
+        finally:
+            b.close()
+
+    def test_send_control_bare_message_matches_json_encoding(self, nm):
+        """Cached empty-payload control frames decode like a full encode."""
+        sent = []
+        nm.send_tcp_data = sent.append
+
+        nm.send_control("TALK_START", {})
+        nm.send_control("TALK_START", {})
+        nm.send_control("TALK_START")
+        nm.send_control("FILE_HEADER", {"size": 3})
+
+        first, second, bare, with_payload = (json.loads(d) for d in sent)
+        assert first["type"] == second["type"] == bare["type"] == "TALK_START"
+        assert first["payload"] == second["payload"] == {}
+        assert bare["payload"] is None
+        assert isinstance(first["timestamp"], float)
+        assert set(first) == {"type", "payload", "timestamp"}
+        assert with_payload["payload"] == {"size": 3}
+        assert set(with_payload) == {"type", "payload", "timestamp"}
+
+    def test_presence_action_templates_match_json_encoding(self):
+        """Templated presence frames should equal a full JSON encode."""
+        reject = _action_frame("REJECT_CONNECTION", "from_id")
+        for value in ("abc123", 'quote " and \\ slash', "ünïcødé", ""):
+            frame = reject(value)
+            assert json.loads(frame) == {"action": "REJECT_CONNECTION", "from_id": value}
+
+    def test_send_file_streams_header_then_one_frame(self, nm, tmp_path):
+        """send_file should send FILE_HEADER, then the file as one framed payload."""
+        path = tmp_path / "msg.wav"
+        path.write_bytes(b"RIFF" + bytes(range(256)) * 40)
+
+        a, b = socket.socketpair()
+        nm.tcp_socket = a
+        try:
+            nm.send_file(str(path))
+            frames = []
+            for _ in range(2):
+                (n,) = struct.unpack("!I", _recv_exact(b, 4))
+                frames.append(bytes(_recv_exact(b, n)))
+        finally:
+            a.close()
+            b.close()
+
+        header = json.loads(frames[0])
+        assert header["type"] == "FILE_HEADER"
+        assert header["payload"] == {"size": path.stat().st_size, "name": "msg.wav"}
+        assert frames[1] == path.read_bytes()
+
+    def test_send_file_error_marks_connection_down(self, nm, tmp_path):
+        """A failed file send should drop the connection like send_tcp_data."""
+        path = tmp_path / "msg.wav"
+        path.write_bytes(b"RIFF")
+        nm.send_tcp_data = lambda data: None
+        nm.tcp_socket = MagicMock()
+        nm.tcp_socket.sendall.side_effect = OSError("broken pipe")
+
+        nm.send_file(str(path))
+
+        assert nm.connected is False
+
+    def test_send_file_sendfile_error_marks_connection_down(self, nm, tmp_path):
+        """A sendfile failure after the length prefix went out should drop the connection."""
+        path = tmp_path / "msg.wav"
+        path.write_bytes(b"RIFF")
+        nm.send_tcp_data = lambda data: None
+        nm.tcp_socket = MagicMock()
+        nm.tcp_socket.sendfile.side_effect = OSError("connection reset")
+
+        nm.send_file(str(path))
+
+        nm.tcp_socket.sendall.assert_called_once_with(struct.pack("!I", 4))
+        assert nm.connected is False
+
+    def test_frame_reader_parses_batched_split_and_large_frames(self):
+        """_FrameReader should handle coalesced, straddling and oversize-buffer frames."""
+        payloads = [b"a" * 5, b"b" * 11, b"c" * 40, b"d" * 9, b""]
+        a, b = socket.socketpair()
+        try:
+            a.sendall(b"".join(_frame(p) for p in payloads[:4]))
+            a.sendall(_frame(payloads[4]))
+            a.close()
+            reader = _FrameReader(b, size=16)
+            got = [bytes(reader.read_frame()) for _ in payloads]
+            assert reader.read_frame() is None
+        finally:
+            b.close()
+
+        assert got == payloads
+
+    def test_frame_reader_rejects_oversized_frame(self):
+        """Frames over MAX_FRAME_SIZE should raise rather than allocate."""
+        from config import MAX_FRAME_SIZE
+
+        a, b = socket.socketpair()
+        try:
+            a.sendall(struct.pack("!I", MAX_FRAME_SIZE + 1))
+            with pytest.raises(ValueError):
+                _FrameReader(b).read_frame()
+        finally:
+            a.close()
+            b.close()
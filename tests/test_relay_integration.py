@@ -6,6 +6,10 @@ sockets — no real network connections.
 """
 
 import json
+import os
+import socket
+import struct
+import threading
 import time
 from unittest.mock import MagicMock
 
@@ -118,6 +122,70 @@ class TestRoomLifecycle:
         relay_server.cleanup_stale_rooms(max_age=3600)
         assert code not in relay_server.rooms
 
+    def test_wait_for_peer_wakes_on_join(self):
+        """wait_for_peer should return the joiner as soon as the room is paired."""
+        code = relay_server.generate_room_code()
+        creator, joiner = make_mock_socket(), make_mock_socket()
+        room = {
+            "clients": [creator],
+            "udp_addrs": [None, None],
+            "created": time.time(),
+            "paired": threading.Event(),
+        }
+        with relay_server.rooms_lock:
+            relay_server.rooms[code] = room
+
+        def join():
+            time.sleep(0.02)
+            with relay_server.rooms_lock:
+                room["clients"].append(joiner)
+                room["paired"].set()
+        threading.Thread(target=join).start()
+
+        start = time.time()
+        assert relay_server.wait_for_peer(code, 5) is joiner
+        assert time.time() - start < 0.5
+
+    def test_wait_for_peer_times_out(self):
+        """wait_for_peer should give up with None if nobody joins."""
+        code = relay_server.generate_room_code()
+        with relay_server.rooms_lock:
+            relay_server.rooms[code] = {
+                "clients": [make_mock_socket()],
+                "udp_addrs": [None, None],
+                "created": time.time(),
+                "paired": threading.Event(),
+            }
+        assert relay_server.wait_for_peer(code, 0.05) is None
+        assert relay_server.wait_for_peer("VOX-NOROOM", 0.05) is None
+
+    def test_udp_routes_map_each_sender_to_its_peers(self):
+        """update_udp_routes should index a room's registered UDP addrs by sender."""
+        a, b, b2 = ("10.0.0.1", 4000), ("10.0.0.2", 4001), ("10.0.0.2", 4002)
+        room = {
+            "clients": [make_mock_socket(), make_mock_socket()],
+            "udp_addrs": [a, None],
+            "created": time.time(),
+        }
+        with relay_server.rooms_lock:
+            relay_server.udp_routes.clear()
+            relay_server.update_udp_routes(room)
+            assert relay_server.udp_routes == {a: ()}
+
+            room["udp_addrs"][1] = b
+            relay_server.update_udp_routes(room)
+            assert relay_server.udp_routes == {a: (b,), b: (a,)}
+
+            # Re-registering from a new port replaces the old entry
+            room["udp_addrs"][1] = b2
+            relay_server.update_udp_routes(room, removed=(b,))
+            assert relay_server.udp_routes == {a: (b2,), b2: (a,)}
+
+            # A member leaving drops its entry and re-points the rest
+            room["udp_addrs"].pop(0)
+            relay_server.update_udp_routes(room, removed=(a,))
+            assert relay_server.udp_routes == {b2: ()}
+
 
 # ── Presence broadcast ───────────────────────────────────────────
 
@@ -156,12 +224,12 @@ class TestPresenceBroadcast:
         with relay_server.presence_lock:
             relay_server.presence["u1"] = {
                 "name": "Alice", "mode": "GREEN", "team_ids": ["team-x"],
-                "sock": sock1, "addr": ("127.0.0.1", 1),
+                "sock": sock1, "addr": ("127.0.0.1", 1), "send_lock": threading.Lock(),
                 "registered_at": time.time(), "last_ping": time.time(),
             }
             relay_server.presence["u2"] = {
                 "name": "Bob", "mode": "YELLOW", "team_ids": ["team-x"],
-                "sock": sock2, "addr": ("127.0.0.1", 2),
+                "sock": sock2, "addr": ("127.0.0.1", 2), "send_lock": threading.Lock(),
                 "registered_at": time.time(), "last_ping": time.time(),
             }
 
@@ -184,12 +252,12 @@ class TestPresenceBroadcast:
         with relay_server.presence_lock:
             relay_server.presence["u1"] = {
                 "name": "Alice", "mode": "GREEN", "team_ids": ["team-x"],
-                "sock": sock1, "addr": ("127.0.0.1", 1),
+                "sock": sock1, "addr": ("127.0.0.1", 1), "send_lock": threading.Lock(),
                 "registered_at": time.time(), "last_ping": time.time(),
             }
             relay_server.presence["u2"] = {
                 "name": "Bob", "mode": "RED", "team_ids": ["team-x"],
-                "sock": make_mock_socket(), "addr": ("127.0.0.1", 2),
+                "sock": make_mock_socket(), "addr": ("127.0.0.1", 2), "send_lock": threading.Lock(),
                 "registered_at": time.time(), "last_ping": time.time(),
             }
 
@@ -205,6 +273,37 @@ class TestPresenceBroadcast:
         assert "Alice" in names
         assert "Bob" in names
 
+    def test_direct_presence_sends_take_client_send_lock(self):
+        """Replies to a presence client must hold its send_lock, like broadcasts."""
+        lock = threading.Lock()
+        held = []
+        sock = make_mock_socket()
+        sock.sendall.side_effect = lambda data: held.append(lock.locked())
+        info = {"sock": sock, "send_lock": lock}
+
+        relay_server.send_presence_json(info, {"type": "CONNECTION_CANCELLED"})
+
+        assert held == [True]
+
+    def test_unchanged_view_is_not_resent(self):
+        """A client whose team view hasn't changed shouldn't get a duplicate frame."""
+        sock = make_mock_socket()
+        with relay_server.presence_lock:
+            relay_server.presence["u1"] = {
+                "name": "Alice", "mode": "GREEN", "team_ids": ["team-x"],
+                "sock": sock, "addr": ("127.0.0.1", 1), "send_lock": threading.Lock(),
+                "registered_at": time.time(), "last_ping": time.time(),
+            }
+
+        relay_server.broadcast_presence()
+        relay_server.broadcast_presence()
+        assert sock.sendall.call_count == 1
+
+        with relay_server.presence_lock:
+            relay_server.presence["u1"]["mode"] = "RED"
+        relay_server.broadcast_presence()
+        assert sock.sendall.call_count == 2
+
 
 # ── Client disconnect cleanup ────────────────────────────────────
 
@@ -237,7 +336,7 @@ class TestClientDisconnectCleanup:
         with relay_server.presence_lock:
             relay_server.presence["dead-user"] = {
                 "name": "Ghost", "mode": "GREEN", "team_ids": ["team-z"],
-                "sock": dead_sock, "addr": ("127.0.0.1", 1),
+                "sock": dead_sock, "addr": ("127.0.0.1", 1), "send_lock": threading.Lock(),
                 "registered_at": time.time(), "last_ping": time.time(),
             }
 
@@ -247,6 +346,25 @@ class TestClientDisconnectCleanup:
         with relay_server.presence_lock:
             assert "dead-user" not in relay_server.presence
 
+    def test_broadcast_sends_outside_presence_lock(self):
+        """A slow client's send must not hold presence_lock."""
+        held = []
+        sock = make_mock_socket()
+        sock.sendall.side_effect = lambda data: held.append(relay_server.presence_lock.locked())
+
+        with relay_server.presence_lock:
+            relay_server.presence["slow-user"] = {
+                "name": "Slow", "mode": "GREEN", "team_ids": ["team-s"],
+                "sock": sock, "addr": ("127.0.0.1", 1), "send_lock": threading.Lock(),
+                "registered_at": time.time(), "last_ping": time.time(),
+            }
+
+        relay_server.broadcast_presence()
+
+        assert held == [False]
+        with relay_server.presence_lock:
+            del relay_server.presence["slow-user"]
+
     def test_room_cleanup_on_client_leave(self):
         """When both clients leave, the room should be deleted."""
         code = relay_server.generate_room_code()
@@ -270,6 +388,55 @@ class TestClientDisconnectCleanup:
             assert code not in relay_server.rooms
 
 
+# ── TCP framing ──────────────────────────────────────────────────
+
+class TestFraming:
+    """Test length-prefixed framing over real sockets."""
+
+    def test_send_frame_roundtrip_on_plain_socket(self):
+        """send_frame's iovec path should arrive as prefix + payload."""
+        a, b = socket.socketpair()
+        try:
+            payload = os.urandom(64 * 1024)
+            t = threading.Thread(target=relay_server.send_frame, args=(a, payload))
+            t.start()
+            assert relay_server.recv_frame(b) == payload
+            t.join()
+        finally:
+            a.close()
+            b.close()
+
+    def test_recv_frame_reassembles_split_writes(self):
+        """recv_frame should collect a frame that arrives in pieces, and return None on EOF."""
+        a, b = socket.socketpair()
+        try:
+            wire = struct.pack('!I', 5) + b"hello"
+            a.sendall(wire[:2])
+
+            def finish():
+                time.sleep(0.02)
+                a.sendall(wire[2:7])
+                time.sleep(0.02)
+                a.sendall(wire[7:])
+                a.shutdown(socket.SHUT_WR)
+            t = threading.Thread(target=finish)
+            t.start()
+            assert relay_server.recv_frame(b) == b"hello"
+            assert relay_server.recv_frame(b) is None
+            t.join()
+        finally:
+            a.close()
+            b.close()
+
+    def test_parse_udp_register_only_matches_registration(self):
+        """Only UDP_REGISTER JSON should be treated as a relay control frame."""
+        reg = json.dumps({"type": "UDP_REGISTER", "udp_port": 5000}).encode()
+        assert relay_server.parse_udp_register(reg) == {"type": "UDP_REGISTER", "udp_port": 5000}
+        assert relay_server.parse_udp_register(b'{"type": "TALK_START"}') is None
+        assert relay_server.parse_udp_register(b'{UDP_REGISTER not json') is None
+        assert relay_server.parse_udp_register(b'\x00\x01UDP_REGISTER') is None
+
+
 # ── Auth key rejection ───────────────────────────────────────────
 
 class TestAuthKeyRejection:
@@ -110,3 +110,22 @@ def test_send_frame_format():
     decoded_len = struct.unpack('!I', frame[:4])[0]
     assert decoded_len == len(data)
     assert frame[4:] == data
+
+
+def test_serve_client_releases_slot_on_error(monkeypatch):
+    """A client slot should be returned even if the handler raises."""
+    import threading
+
+    import pytest
+
+    import relay_server
+
+    def boom(*args):
+        raise RuntimeError("handler failed")
+
+    monkeypatch.setattr(relay_server, "handle_client", boom)
+    monkeypatch.setattr(relay_server, "client_slots", threading.BoundedSemaphore(1))
+    assert relay_server.client_slots.acquire(blocking=False)
+    with pytest.raises(RuntimeError):
+        relay_server.serve_client(None, ("127.0.0.1", 1), None)
+    assert relay_server.client_slots.acquire(blocking=False)
@@ -20,6 +20,14 @@ def test_mode_labels_defined():
     assert MODE_LABELS["RED"] == "DND"
 
 
+def test_mode_meta_matches_labels_and_colors():
+    """MODE_META should pair each mode's label with its colour."""
+    from ui_constants import COLORS, MODE_LABELS, MODE_META
+    for mode, label in MODE_LABELS.items():
+        assert MODE_META[mode].label == label
+        assert MODE_META[mode].color == COLORS[mode]
+
+
 def test_dark_theme_has_required_keys():
     """Dark theme palette should have all required keys."""
     from ui_constants import DARK
@@ -154,3 +154,37 @@ def test_load_settings_handles_corrupt_file(patched_settings):
         f.write("not valid json {{{")
     result = user_settings.load_settings()
     assert result == {}
+
+
+def test_save_settings_leaves_no_temp_file(patched_settings):
+    """save_settings() should replace the file atomically, not leave a .tmp behind."""
+    import os
+    import user_settings
+    user_settings.save_settings({"key": "value"})
+    user_settings.save_settings({"key": "other"})
+    assert not os.path.exists(patched_settings + ".tmp")
+    with open(patched_settings) as f:
+        assert json.load(f) == {"key": "other"}
+
+
+def test_getters_read_cache_not_disk(patched_settings, monkeypatch):
+    """Once loaded, getters should be served from memory."""
+    import builtins
+    import user_settings
+    user_settings.set_display_name("Cached")
+    assert user_settings.get_display_name() == "Cached"
+
+    def no_open(*args, **kwargs):
+        raise AssertionError("settings file re-read")
+    monkeypatch.setattr(builtins, "open", no_open)
+    assert user_settings.get_display_name() == "Cached"
+    assert len(user_settings.get_user_id()) >= 16
+
+
+def test_load_settings_returns_independent_copy(patched_settings):
+    """Mutating load_settings()'s result shouldn't leak into the cache."""
+    import user_settings
+    user_settings.save_settings({"trusted_peers": {"a": "1"}})
+    settings = user_settings.load_settings()
+    settings["trusted_peers"]["b"] = "2"
+    assert user_settings.get_trusted_peers() == {"a": "1"}
@@ -2,6 +2,7 @@
 ui_constants.py — Shared UI constants for Vox
 Colour palettes, mode labels, dimensions used by both widgets and the panel.
 """
+from collections import namedtuple
 
 # ── Color Constants ──────────────────────────────────────────────
 COLORS = {
@@ -17,6 +18,10 @@ MODE_LABELS = {
     'RED':    'DND',
 }
 
+# Label + colour per mode in one lookup
+ModeMeta = namedtuple('ModeMeta', 'label color')
+MODE_META = {mode: ModeMeta(label, COLORS[mode]) for mode, label in MODE_LABELS.items()}
+
 RADIO_STATIONS = {
     'NTS Radio': 'https://stream-relay-geo.ntslive.net/stream?client=NTSRadio',
 }
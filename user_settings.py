@@ -1,7 +1,9 @@
+import copy
 import hashlib
 import json
 import os
 import sys
+import threading
 import uuid
 
 
@@ -73,33 +75,61 @@ for _old, _new in [
         except Exception:
             pass
 
+# In-memory copy of the settings file. Read once, then kept in step by
+# save_settings(), so getters don't re-open and re-parse the file.
+_cache = None
+_cache_path = None
+_cache_lock = threading.Lock()
+
+def _settings():
+    """Return the cached settings dict, reading the file on first use.
+    Shared — callers must not mutate it."""
+    global _cache, _cache_path
+    with _cache_lock:
+        if _cache is None or _cache_path != SETTINGS_FILE:
+            settings = {}
+            if os.path.exists(SETTINGS_FILE):
+                try:
+                    with open(SETTINGS_FILE) as f:
+                        settings = json.load(f)
+                except Exception:
+                    pass
+            _cache, _cache_path = settings, SETTINGS_FILE
+        return _cache
+
 def load_settings():
     """Load user settings from disk, or return defaults"""
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE) as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+    return copy.deepcopy(_settings())
 
 def save_settings(settings):
-    """Save user settings to disk"""
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=2)
+    """Save user settings to disk.
+    Written to a temp file and renamed over the original, so a crash
+    mid-write can't leave a truncated settings file behind."""
+    global _cache, _cache_path
+    with _cache_lock:
+        tmp = SETTINGS_FILE + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(settings, f, indent=2)
+        try:
+            os.chmod(tmp, os.stat(SETTINGS_FILE).st_mode & 0o777)
+        except OSError:
+            pass  # No existing file — keep default permissions
+        os.replace(tmp, SETTINGS_FILE)
+        _cache, _cache_path = copy.deepcopy(settings), SETTINGS_FILE
 
 def get_display_name():
     """Get the user's display name, or None if not set"""
-    return load_settings().get("display_name")
+    return _settings().get("display_name")
 
 def get_user_id():
     """Get or create a persistent user ID (full UUID for collision resistance)"""
+    user_id = _settings().get("user_id", "")
+    if len(user_id) >= 16:
+        return user_id
     settings = load_settings()
-    user_id = settings.get("user_id", "")
     # Migrate short IDs (8 chars) to full UUIDs
-    if len(user_id) < 16:
-        settings["user_id"] = str(uuid.uuid4())
-        save_settings(settings)
+    settings["user_id"] = str(uuid.uuid4())
+    save_settings(settings)
     return settings["user_id"]
 
 def set_display_name(name):
@@ -114,10 +144,9 @@ def set_display_name(name):
 def get_auth_session():
     """Return the stored auth session dict, or None if not logged in.
     Session contains: access_token, refresh_token, expires_at, user_id, email."""
-    settings = load_settings()
-    session = settings.get("auth_session")
+    session = _settings().get("auth_session")
     if session and session.get("access_token"):
-        return session
+        return dict(session)
     return None
 
 
@@ -149,7 +178,7 @@ def is_logged_in():
 
 def get_ptt_hotkey():
     """Get the configured PTT hotkey name, or None for default."""
-    return load_settings().get("ptt_hotkey")
+    return _settings().get("ptt_hotkey")
 
 def set_ptt_hotkey(key_name):
     """Set the PTT hotkey name."""
@@ -161,7 +190,7 @@ def set_ptt_hotkey(key_name):
 
 def get_active_team_ids():
     """Get the list of active team IDs (teams with presence enabled)."""
-    return load_settings().get("active_team_ids", [])
+    return list(_settings().get("active_team_ids", []))
 
 def set_active_team_ids(team_ids):
     """Save the list of active team IDs."""
@@ -173,7 +202,7 @@ def set_active_team_ids(team_ids):
 
 def get_deck_guide_dismissed():
     """Check if user dismissed the Stream Deck setup guide."""
-    return load_settings().get("deck_guide_dismissed", False)
+    return _settings().get("deck_guide_dismissed", False)
 
 def set_deck_guide_dismissed(dismissed=True):
     """Mark the Stream Deck setup guide as dismissed."""
@@ -185,8 +214,7 @@ def set_deck_guide_dismissed(dismissed=True):
 
 def get_trusted_peers():
     """Get dict of trusted peer fingerprints: {ip_or_name: sha256_hex}"""
-    settings = load_settings()
-    return settings.get("trusted_peers", {})
+    return dict(_settings().get("trusted_peers", {}))
 
 def trust_peer(peer_id, fingerprint):
     """Store a peer's certificate fingerprint as trusted"""
@@ -198,7 +226,7 @@ def trust_peer(peer_id, fingerprint):
 
 def get_peer_fingerprint(peer_id):
     """Get the stored fingerprint for a peer, or None"""
-    return get_trusted_peers().get(peer_id)
+    return _settings().get("trusted_peers", {}).get(peer_id)
 
 def compute_cert_fingerprint(cert_der):
     """Compute SHA-256 fingerprint of a DER-encoded certificate"""